@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Demonstration of ELESS streaming processing for large files.
+
+Creates throwaway text files of increasing size and runs them through
+StreamingDocumentProcessor / BatchProcessor to show how ELESS keeps
+memory usage flat regardless of file size.
+
+Run from the repository root:
+    python demo_streaming.py
+"""
+
+import os
+import sys
+import mmap
+import logging
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+try:
+    from eless.core.default_config import get_default_config
+    from eless.core.resource_monitor import ResourceMonitor
+    from eless.processing.streaming_processor import (
+        StreamingDocumentProcessor,
+        BatchProcessor,
+    )
+except ImportError:
+    # Running from a source checkout without `pip install -e .`
+    sys.path.insert(0, str(Path(__file__).parent / "src"))
+    from eless.core.default_config import get_default_config
+    from eless.core.resource_monitor import ResourceMonitor
+    from eless.processing.streaming_processor import (
+        StreamingDocumentProcessor,
+        BatchProcessor,
+    )
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("ELESS.DemoStreaming")
+
+
+def create_test_file(size_mb: int) -> Path:
+    """
+    Create a temporary text file of roughly ``size_mb`` megabytes.
+
+    Args:
+        size_mb: Target file size in megabytes.
+
+    Returns:
+        Path to the created temporary file.
+    """
+    content_pattern = b"This is a test sentence. "
+    target_size = size_mb * 1024 * 1024
+
+    # One fd from creation through writing: the old mktemp + reopen pattern
+    # cost an extra open/stat pair per file and was a TOCTOU race.
+    tmp = tempfile.NamedTemporaryFile(
+        "wb", suffix=".txt", delete=False, buffering=1 << 20
+    )
+    test_file = Path(tmp.name)
+
+    with tmp:
+        # Fast path: the demo only cares about file *size*, so on platforms
+        # with posix_fallocate we can reserve the extents in O(1) syscalls and
+        # write a single pattern page, instead of pushing every byte through
+        # Python.
+        if hasattr(os, "posix_fallocate"):
+            fd = tmp.fileno()
+            os.posix_fallocate(fd, 0, target_size)
+            os.ftruncate(fd, target_size)
+            page = (content_pattern * (4096 // len(content_pattern) + 1))[:4096]
+            os.pwrite(fd, page[: min(4096, target_size)], 0)
+            return test_file
+
+        # Fallback: repeat the pattern into a 64KB block once and write whole
+        # blocks, so the write path is bandwidth-bound instead of
+        # compute-bound in a per-pattern Python loop.
+        block = content_pattern * max(1, (64 * 1024) // len(content_pattern))
+
+        if hasattr(os, "writev"):
+            # Scatter-gather write: the kernel consumes many iovec references
+            # to the same pattern block in a single syscall, instead of one
+            # write() per block.
+            try:
+                iov_max = os.sysconf("SC_IOV_MAX")
+            except (AttributeError, ValueError, OSError):
+                iov_max = 1024
+            fd = tmp.fileno()
+            mv = memoryview(block)
+            written = 0
+            while written < target_size:
+                remaining = target_size - written
+                n_blocks = min(iov_max, (remaining + len(block) - 1) // len(block))
+                iov = [mv] * n_blocks
+                tail = remaining - (n_blocks - 1) * len(block)
+                if tail < len(block):
+                    iov[-1] = mv[:tail]
+                written += os.writev(fd, iov)
+            return test_file
+
+        written = 0
+        while written < target_size:
+            remaining = target_size - written
+            written += tmp.write(block[:remaining] if remaining < len(block) else block)
+
+    return test_file
+
+
+def dummy_chunker(raw_text, file_hash: str, chunk_size: int, chunk_overlap: int):
+    """
+    Minimal stand-in for the real text chunker.
+
+    Splits ``raw_text`` into fixed-size overlapping chunks. Offsets are
+    precomputed with NumPy and the text is sliced through a single
+    ``memoryview`` so each chunk costs one O(1) slice instead of repeated
+    Python string copies over a potentially very large buffer.
+
+    Args:
+        raw_text: Full text content to chunk; accepts str or a bytes-like
+            object (bytes, mmap, memoryview) to avoid building a giant str
+            for content that is already on disk.
+        file_hash: Unique hash identifier for the file.
+        chunk_size: Maximum chunk size in bytes.
+        chunk_overlap: Overlap between consecutive chunks in bytes.
+
+    Yields:
+        Chunk dictionaries with 'text' and 'metadata' keys. Consuming the
+        chunks lazily keeps resident chunk metadata O(1) instead of O(N)
+        for large files.
+    """
+    if not raw_text:
+        return
+
+    if isinstance(raw_text, str):
+        buf = memoryview(raw_text.encode("utf-8"))
+    else:
+        buf = memoryview(raw_text)
+    stride = max(1, chunk_size - chunk_overlap)
+
+    # Chunk count and all offsets fall out analytically from the stride, so
+    # the emit loop below carries no termination guard or offset arithmetic.
+    n_chunks = (len(buf) + stride - 1) // stride
+    starts = np.arange(n_chunks, dtype=np.int64) * stride
+    ends = np.minimum(starts + chunk_size, len(buf))
+
+    # Bind the id formatter once: a single C-level %-format per chunk instead
+    # of re-parsing an f-string format spec 50k times on a large file.
+    make_id = (file_hash[:8] + "-%04d").__mod__
+    for chunk_index, (s, e) in enumerate(zip(starts.tolist(), ends.tolist())):
+        yield {
+            "text": bytes(buf[s:e]).decode("utf-8", "ignore"),
+            "metadata": {
+                "file_hash": file_hash,
+                "chunk_id": make_id(chunk_index),
+                "chunk_index": chunk_index,
+            },
+        }
+
+
+def preadv_block_reader(file_path: Path, block_size: int = 8192, batch: int = 16):
+    """
+    Read a file as text blocks, filling ``batch`` buffers per syscall.
+
+    Uses os.preadv to scatter-read a batch of fixed-size buffers with a
+    single syscall, amortizing per-read overhead across the batch (the
+    userland analog of batched io_uring submission). Falls back to plain
+    buffered reads on platforms without preadv.
+
+    Args:
+        file_path: Path to the file to read.
+        block_size: Size of each read buffer in bytes.
+        batch: Number of buffers filled per syscall.
+
+    Yields:
+        Decoded text blocks.
+    """
+    if not hasattr(os, "preadv"):
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+            while True:
+                block = f.read(block_size)
+                if not block:
+                    return
+                yield block
+        return
+
+    fd = os.open(str(file_path), os.O_RDONLY)
+    try:
+        buffers = [bytearray(block_size) for _ in range(batch)]
+        offset = 0
+        while True:
+            n = os.preadv(fd, buffers, offset)
+            if n <= 0:
+                return
+            offset += n
+            for buf in buffers:
+                if n <= 0:
+                    break
+                filled = min(n, block_size)
+                yield bytes(buf[:filled]).decode("utf-8", "ignore")
+                n -= filled
+    finally:
+        os.close(fd)
+
+
+def sorted_windows(chunks, window_size: int = 4096):
+    """
+    Buffer chunks into windows and yield each window sorted by text length.
+
+    Length-sorted batches keep transformer padding tight, which is the
+    single biggest batching win on encoder throughput. Each chunk gets an
+    'original_index' in its metadata so outputs can be re-ordered after
+    encoding (e.g. with numpy.argsort).
+
+    Args:
+        chunks: Iterable of chunk dictionaries.
+        window_size: Number of chunks to buffer per sorting window.
+
+    Yields:
+        Lists of chunk dicts, sorted by len(chunk['text']) within a window.
+    """
+    window = []
+    index = 0
+    for chunk in chunks:
+        chunk["metadata"]["original_index"] = index
+        index += 1
+        window.append(chunk)
+        if len(window) >= window_size:
+            window.sort(key=lambda c: len(c["text"]))
+            yield window
+            window = []
+    if window:
+        window.sort(key=lambda c: len(c["text"]))
+        yield window
+
+
+def bucket(chunks, max_batch: int = 128, window_size: int = 4096):
+    """
+    Aggregate chunks into fixed-shape padded batches for the encoder.
+
+    Buffers chunks into length-sorted windows, then emits batches whose
+    sizes are powers of two (up to ``max_batch``) padded to a power-of-two
+    text length, so an encoder sees a small set of recurring shape
+    specializations instead of a new ragged shape every batch. Combined
+    with the length sort, padding waste inside each batch stays small.
+
+    Args:
+        chunks: Iterable of chunk dictionaries.
+        max_batch: Upper bound on batch size (rounded down to a power of 2).
+        window_size: Number of chunks buffered per sorting window.
+
+    Yields:
+        (batch, padded_len) tuples where batch is a list of chunk dicts and
+        padded_len is the power-of-two length the batch pads to.
+    """
+    for window in sorted_windows(chunks, window_size):
+        i = 0
+        while i < len(window):
+            batch = window[i : i + max_batch]
+            # Truncate to the largest power of two so batch shapes repeat
+            size = 1 << (len(batch).bit_length() - 1)
+            batch = batch[:size]
+            max_len = max(len(c["text"]) for c in batch)
+            padded_len = 1 << max(1, (max_len - 1).bit_length())
+            yield batch, padded_len
+            i += size
+
+
+def dummy_processor(batch):
+    """
+    Toy batch processor standing in for the real embedding callback.
+
+    String construction happens in a single vectorized NumPy pass rather
+    than a Python-level loop; a real embedding adapter should likewise
+    accept and produce whole ndarray batches so consumers can copy memory
+    instead of iterating items in the interpreter.
+    """
+    arr = np.asarray(batch, dtype=str)
+    return np.char.add("processed_", arr).tolist()
+
+
+def demonstrate_streaming():
+    """Run the streaming demonstration over a range of file sizes."""
+    config = get_default_config()
+    config["streaming"]["max_file_size_mb"] = 50
+
+    resource_monitor = ResourceMonitor(config)
+    streaming_processor = StreamingDocumentProcessor(config)
+    batch_processor = BatchProcessor(config, resource_monitor)
+
+    test_sizes = [1, 5, 25]
+
+    for size_mb in test_sizes:
+        print(f"\n--- Processing {size_mb}MB file ---")
+        test_file = create_test_file(size_mb)
+
+        try:
+            file_hash = f"demo{size_mb:04d}" + "0" * 24
+
+            if streaming_processor.should_use_streaming(test_file):
+                chunk_count = 0
+                chunk_stream = streaming_processor.process_large_text_file(
+                    test_file,
+                    file_hash,
+                    dummy_chunker,
+                    text_stream=preadv_block_reader(
+                        test_file, config["streaming"]["buffer_size"]
+                    ),
+                )
+                # Length-sorted power-of-two batches: the encoder sees a few
+                # recurring padded shapes instead of ragged per-batch padding.
+                for batch, _padded_len in bucket(chunk_stream):
+                    chunk_count += len(batch)
+                    if chunk_count % 100 < len(batch):
+                        # Lazy %-formatting: no string is built when the
+                        # log level filters this out
+                        logger.info("  Processed %d chunks...", chunk_count)
+                print(f"  Streaming complete: {chunk_count} chunks")
+            else:
+                # Memory-map instead of f.read(): pages are demand-paged by
+                # the kernel and no full-file str is ever built; decode cost
+                # is paid per chunk at yield time inside the chunker.
+                with open(test_file, "rb") as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        chunk_count = sum(
+                            1
+                            for _ in dummy_chunker(
+                                raw_text=mm,
+                                file_hash=file_hash,
+                                chunk_size=config["chunking"]["chunk_size"],
+                                chunk_overlap=config["chunking"]["chunk_overlap"],
+                            )
+                        )
+                    finally:
+                        mm.close()
+                print(f"  Regular processing complete: {chunk_count} chunks")
+
+            metrics = resource_monitor.get_current_metrics()
+            print(f"  Memory usage: {metrics.memory_percent:.1f}%")
+
+        finally:
+            test_file.unlink(missing_ok=True)
+
+    # Demonstrate adaptive batching with a toy workload
+    print("\n--- Adaptive batch processing ---")
+    test_items = list(range(1000))
+    # Same pre-sort pattern as the streaming path: group similar items so
+    # batches stay uniform for the processor.
+    test_items.sort(key=str)
+    batch_count = 0
+    for result in batch_processor.process_in_batches(test_items, dummy_processor):
+        batch_count += 1
+    print(f"  Processed {len(test_items)} items in {batch_count} batches")
+
+
+if __name__ == "__main__":
+    demonstrate_streaming()
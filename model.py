@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Download and locally cache the ELESS embedding model.
+
+Fetches the default SentenceTransformer model and saves it under
+./models/minilm_v2_local, where ModelLoader picks it up for offline use.
+
+Run from the repository root:
+    python model.py [--onnx] [--reserialize]
+
+By default the raw model files are fetched via snapshot_download (symlinked
+into the HF cache, so no second on-disk copy and no tensor round-trip in
+Python). If the local path is already populated the script exits
+immediately.
+
+With --reserialize, the model is instead loaded through
+SentenceTransformer and re-saved locally with half-precision weights --
+use this when the smaller FP16/BF16 checkpoint is worth the one-off
+serialization cost.
+
+With --onnx, additionally exports an ONNX Runtime-optimized copy of the
+model (graph/kernel fusion plus dynamic int8 quantization) under
+./models/minilm_v2_local/onnx. Requires the optional optimum[onnxruntime]
+package.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Parallelize the download leg with the Rust hf_transfer backend when the
+# optional package is installed; must be set before any HF import.
+os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+LOCAL_PATH = os.path.join("models", "minilm_v2_local")
+
+
+def export_onnx(local_path: str) -> bool:
+    """
+    Export an ORT-optimized, int8-quantized ONNX copy of the saved model.
+
+    CPU encode on the eager PyTorch checkpoint re-pays dispatch overhead on
+    every forward pass; the fused + quantized ONNX graph typically runs
+    2-5x faster on CPU. Returns True on success.
+    """
+    try:
+        from optimum.onnxruntime import (
+            ORTModelForFeatureExtraction,
+            ORTOptimizer,
+            ORTQuantizer,
+        )
+        from optimum.onnxruntime.configuration import (
+            AutoQuantizationConfig,
+            OptimizationConfig,
+        )
+    except ImportError:
+        print(
+            "ONNX export requires the optimum package. "
+            "Install with: pip install optimum[onnxruntime]"
+        )
+        return False
+
+    onnx_path = os.path.join(local_path, "onnx")
+
+    print("Exporting ONNX model...")
+    ort_model = ORTModelForFeatureExtraction.from_pretrained(local_path, export=True)
+    ort_model.save_pretrained(onnx_path)
+
+    print("Optimizing ONNX graph (kernel fusion)...")
+    optimizer = ORTOptimizer.from_pretrained(ort_model)
+    optimizer.optimize(
+        optimization_config=OptimizationConfig(optimization_level=99),
+        save_dir=onnx_path,
+    )
+
+    print("Quantizing to dynamic int8...")
+    quantizer = ORTQuantizer.from_pretrained(onnx_path)
+    quantizer.quantize(
+        quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False),
+        save_dir=onnx_path,
+    )
+
+    print(f"ONNX model saved to {onnx_path}")
+    return True
+
+
+def optimize_for_inference(model):
+    """
+    Apply inference-only optimizations to the inner transformer in place.
+
+    BetterTransformer swaps in fused SDPA attention kernels and skips
+    padding work via nested tensors; torch.compile removes eager-mode
+    dispatch overhead. Applied after save since compiled/converted modules
+    do not serialize cleanly -- the saved checkpoint stays loadable
+    everywhere and loaders re-apply this on the instance they encode with.
+    Each step is best-effort since support depends on the installed
+    torch/optimum versions.
+    """
+    try:
+        auto_model = model._first_module().auto_model
+    except AttributeError:
+        return model
+
+    try:
+        auto_model = auto_model.to_bettertransformer()
+        print("Applied BetterTransformer (fused SDPA kernels)")
+    except Exception as e:
+        print(f"BetterTransformer not applied: {e}")
+
+    try:
+        import torch
+
+        auto_model = torch.compile(auto_model, mode="reduce-overhead", fullgraph=False)
+        print("Applied torch.compile (reduce-overhead)")
+    except Exception as e:
+        print(f"torch.compile not applied: {e}")
+
+    model._first_module().auto_model = auto_model.eval()
+    return model
+
+
+def download_only() -> int:
+    """
+    Fetch the raw model files without loading them into Python.
+
+    snapshot_download streams the repository files straight to disk (multi-
+    connection when hf_transfer is installed), skipping the FP32 tensor
+    materialization that a SentenceTransformer construction would pay.
+    """
+    try:
+        from huggingface_hub import snapshot_download
+    except ImportError:
+        print(
+            "huggingface_hub not available. "
+            "Install with: pip install huggingface-hub"
+        )
+        return 1
+
+    print(f"Downloading {MODEL_NAME} (files only)...")
+    # Symlink into the HF cache: avoids a second ~90MB on-disk copy and the
+    # full tensor->bytes reserialization a model.save round-trip would pay.
+    snapshot_download(
+        repo_id=MODEL_NAME,
+        local_dir=LOCAL_PATH,
+        local_dir_use_symlinks=True,
+        allow_patterns=["*.safetensors", "*.json", "*.txt"],
+    )
+    print(f"Model files saved to {LOCAL_PATH}")
+    return 0
+
+
+def reserialize() -> int:
+    """Load via SentenceTransformer and re-save locally (half-precision)."""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        print(
+            "SentenceTransformers library not available. "
+            "Install with: pip install sentence-transformers"
+        )
+        return 1
+
+    print(f"Downloading {MODEL_NAME}...")
+    # Prefer safetensors with low_cpu_mem_usage so weights are memory-mapped
+    # from disk pages on demand instead of being deserialized through pickle
+    # into a fully materialized FP32 tensor graph.
+    model = SentenceTransformer(
+        MODEL_NAME,
+        model_kwargs={
+            "use_safetensors": True,
+            "low_cpu_mem_usage": True,
+        },
+    )
+
+    # Half-precision weights halve the on-disk footprint (~90MB -> ~45MB for
+    # MiniLM-L6) and double effective memory bandwidth during encode. BF16 is
+    # preferred on CPUs with native AVX-512 BF16 support, FP16 on CUDA;
+    # otherwise keep FP32 for platforms without fast half-precision kernels.
+    try:
+        import torch
+
+        if torch.cuda.is_available():
+            dtype = torch.float16
+        elif getattr(torch.cpu, "_is_cpu_support_avx512_bf16", lambda: False)():
+            dtype = torch.bfloat16
+        else:
+            dtype = None
+
+        if dtype is not None:
+            model._first_module().auto_model = model._first_module().auto_model.to(
+                dtype
+            )
+            print(f"Cast weights to {dtype} before save")
+    except Exception as e:
+        print(f"Half-precision cast skipped: {e}")
+
+    os.makedirs(LOCAL_PATH, exist_ok=True)
+    model.save(LOCAL_PATH)
+    print(f"Model saved to {LOCAL_PATH}")
+
+    optimize_for_inference(model)
+    return 0
+
+
+def main() -> int:
+    argv = sys.argv[1:]
+
+    # Warm path: fetching is a no-op if the model is already local
+    local = Path(LOCAL_PATH)
+    if local.is_dir() and any(local.iterdir()):
+        print(f"Model already cached at {LOCAL_PATH}")
+    elif "--reserialize" in argv:
+        rc = reserialize()
+        if rc:
+            return rc
+    else:
+        rc = download_only()
+        if rc:
+            return rc
+
+    if "--onnx" in argv:
+        if not export_onnx(LOCAL_PATH):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
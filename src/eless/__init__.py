@@ -8,9 +8,15 @@ multi-database support, and CLI interface.
 __version__ = "1.0.0"
 __author__ = "ELESS Team"
 
-from .eless_pipeline import ElessPipeline
-from .core.state_manager import StateManager, FileStatus
-from .core.config_loader import ConfigLoader
+# Public classes resolve lazily (PEP 562): importing the package must not
+# drag in the full pipeline/dispatcher/connector chain, or the CLI's
+# per-command lazy imports are defeated before any command runs.
+_LAZY_EXPORTS = {
+    "ElessPipeline": ("eless.eless_pipeline", "ElessPipeline"),
+    "StateManager": ("eless.core.state_manager", "StateManager"),
+    "FileStatus": ("eless.core.state_manager", "FileStatus"),
+    "ConfigLoader": ("eless.core.config_loader", "ConfigLoader"),
+}
 
 __all__ = [
     "ElessPipeline",
@@ -19,3 +25,19 @@ __all__ = [
     "ConfigLoader",
     "__version__",
 ]
+
+
+def __getattr__(name):
+    try:
+        module_name, attr_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), attr_name)
+    globals()[name] = value  # Cache so subsequent lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
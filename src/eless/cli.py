@@ -1,46 +1,95 @@
 import click
+import functools
 import os
+import sys
+import time
 import yaml
 import logging
+from bisect import bisect_left
 from pathlib import Path
 from typing import List, Optional
 
-from eless.core.state_manager import StateManager
-from eless.processing.file_scanner import FileScanner
-from eless.processing.dispatcher import Dispatcher
-from eless.embedding.model_loader import ModelLoader
-from eless.embedding.embedder import Embedder
-from eless.database.db_loader import DatabaseLoader as DBFactory
-from eless.core.archiver import Archiver
 from eless.core.logging_config import setup_logging
-from eless.core.config_loader import ConfigLoader
-from eless.core.resource_monitor import ResourceMonitor
+from eless.core.config_loader import ConfigLoader, YAML_SAFE_DUMPER
+
+# Heavy pipeline modules (StateManager, Dispatcher, ModelLoader, Embedder,
+# DBFactory, ...) transitively pull in torch/sentence-transformers/vector-DB
+# clients; they are imported inside the subcommands that actually use them so
+# --help, status and friends do not pay seconds of import time for nothing.
 
 
 # --- Configuration Loading ---
+@functools.lru_cache(maxsize=1)
 def get_default_config_path():
-    """Get the default configuration file path if it exists."""
-    # Try development location first
-    dev_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)), "config", "default_config.yaml"
-    )
-    if os.path.exists(dev_path):
-        return dev_path
+    """Get the default configuration file path if it exists.
 
-    # Try relative to current working directory
-    cwd_path = os.path.join(os.getcwd(), "config", "default_config.yaml")
-    if os.path.exists(cwd_path):
-        return cwd_path
+    Probes each candidate with a single stat (instead of exists + later
+    open) and caches the result for the life of the process.
+    """
+    candidates = (
+        # Development location first
+        os.path.join(
+            os.path.dirname(os.path.dirname(__file__)), "config", "default_config.yaml"
+        ),
+        # Then relative to current working directory
+        os.path.join(os.getcwd(), "config", "default_config.yaml"),
+    )
+    for candidate in candidates:
+        try:
+            os.stat(candidate)
+            return candidate
+        except OSError:
+            continue
 
     # Return None if not found - ConfigLoader will use embedded defaults
     return None
 
 
 DEFAULT_CONFIG_PATH = get_default_config_path()
+# Wrapped once; every subcommand resolving its config path reuses this
+# instead of re-parsing the string into a fresh Path
+_DEFAULT_CONFIG_PATH_OBJ = Path(DEFAULT_CONFIG_PATH) if DEFAULT_CONFIG_PATH else None
 
 # Available database options
 AVAILABLE_DATABASES = ["chroma", "qdrant", "faiss", "postgresql", "cassandra"]
 
+# Group-level directory overrides: (ctx key, (section, key), data_dir
+# fallback). A set ctx value wins; otherwise --data-dir supplies the
+# fallback subdirectory. One table instead of the same if-chain copied
+# into every subcommand.
+_CTX_OVERRIDES = (
+    ("log_level", ("logging", "level"), None),
+    ("log_dir", ("logging", "directory"), ".eless_logs"),
+    ("cache_dir", ("cache", "directory"), ".eless_cache"),
+)
+
+
+# Shared status-color scale for percentage gauges; bisect_left keeps the
+# strict greater-than semantics of the old per-gauge ternaries
+_STATUS_COLORS = ("green", "yellow", "red")
+
+
+def _status_color(percent, thresholds=(80, 90)):
+    """Map a utilization percentage onto green/yellow/red."""
+    return _STATUS_COLORS[bisect_left(thresholds, percent)]
+
+
+def apply_ctx_overrides(ctx, cli_overrides):
+    """Fold the group-level options from ctx.obj into cli_overrides.
+
+    Applies the _CTX_OVERRIDES table in one pass and returns cli_overrides
+    for chaining.
+    """
+    obj = ctx.obj or {}
+    data_dir = obj.get("data_dir")
+    for ctx_key, (section, key), fallback_subdir in _CTX_OVERRIDES:
+        value = obj.get(ctx_key)
+        if not value and data_dir and fallback_subdir:
+            value = str(Path(data_dir) / fallback_subdir)
+        if value:
+            cli_overrides.setdefault(section, {})[key] = value
+    return cli_overrides
+
 
 @click.group()
 @click.option(
@@ -228,11 +277,7 @@ def process(
     # Load and merge configuration
     try:
         # Use provided config file or fall back to embedded defaults
-        config_path = (
-            Path(config)
-            if config
-            else (Path(DEFAULT_CONFIG_PATH) if DEFAULT_CONFIG_PATH else None)
-        )
+        config_path = Path(config) if config else _DEFAULT_CONFIG_PATH_OBJ
         config_loader = ConfigLoader(config_path)
         cli_overrides = {}
 
@@ -242,14 +287,12 @@ def process(
             cli_overrides["databases"] = {"batch_size": batch_size}
 
         # Handle parallel processing overrides
-        if any(
-            [
-                parallel_workers is not None,
-                parallel_mode,
-                disable_parallel_files,
-                disable_parallel_embedding,
-                disable_parallel_db,
-            ]
+        if (
+            parallel_workers is not None
+            or parallel_mode
+            or disable_parallel_files
+            or disable_parallel_embedding
+            or disable_parallel_db
         ):
             cli_overrides["parallel_processing"] = {}
 
@@ -290,43 +333,24 @@ def process(
                 ] = False
             if disable_parallel_db:
                 cli_overrides["parallel_processing"]["enable_parallel_database"] = False
-        if ctx.obj.get("log_level"):
-            cli_overrides["logging"] = {"level": ctx.obj["log_level"]}
-        if ctx.obj.get("log_dir"):
-            cli_overrides["logging"] = cli_overrides.get("logging", {})
-            cli_overrides["logging"]["directory"] = ctx.obj["log_dir"]
-        if ctx.obj.get("cache_dir"):
-            cli_overrides["cache"] = {"directory": ctx.obj["cache_dir"]}
+        apply_ctx_overrides(ctx, cli_overrides)
         if ctx.obj.get("data_dir"):
-            # Set parent directory for all data storage
             data_dir = ctx.obj["data_dir"]
-            if "logging" not in cli_overrides:
-                cli_overrides["logging"] = {}
-            if "cache" not in cli_overrides:
-                cli_overrides["cache"] = {}
-
-            # Set subdirectories under data_dir if not specifically overridden
-            if not ctx.obj.get("log_dir"):
-                cli_overrides["logging"]["directory"] = str(
-                    Path(data_dir) / ".eless_logs"
-                )
-            if not ctx.obj.get("cache_dir"):
-                cli_overrides["cache"]["directory"] = str(
-                    Path(data_dir) / ".eless_cache"
-                )
-
-            # Update database paths to be under data_dir
-            cli_overrides["databases"] = {"connections": {}}
-            # Update ChromaDB path
-            cli_overrides["databases"]["connections"]["chroma"] = {
-                "type": "chroma",
-                "path": str(Path(data_dir) / ".eless_chroma"),
-            }
-            # Update FAISS paths
-            cli_overrides["databases"]["connections"]["faiss"] = {
-                "type": "faiss",
-                "index_path": str(Path(data_dir) / ".eless_faiss" / "index.faiss"),
-                "metadata_path": str(Path(data_dir) / ".eless_faiss" / "metadata.json"),
+            # Update database paths to be under data_dir; setdefault keeps a
+            # --batch-size override from being clobbered
+            databases = cli_overrides.setdefault("databases", {})
+            databases["connections"] = {
+                "chroma": {
+                    "type": "chroma",
+                    "path": str(Path(data_dir) / ".eless_chroma"),
+                },
+                "faiss": {
+                    "type": "faiss",
+                    "index_path": str(Path(data_dir) / ".eless_faiss" / "index.faiss"),
+                    "metadata_path": str(
+                        Path(data_dir) / ".eless_faiss" / "metadata.json"
+                    ),
+                },
             }
 
         app_config = config_loader.get_final_config(None, **cli_overrides)
@@ -352,6 +376,15 @@ def process(
     try:
         # 2. Initialize Core Components (pre-model)
         logger.info("Initializing core components...")
+        from eless.core.archiver import Archiver
+        from eless.core.resource_monitor import ResourceMonitor
+        from eless.core.state_manager import StateManager
+        from eless.database.db_loader import DatabaseLoader as DBFactory
+        from eless.embedding.embedder import Embedder
+        from eless.embedding.model_loader import ModelLoader
+        from eless.processing.dispatcher import Dispatcher
+        from eless.processing.file_scanner import FileScanner
+
         archiver = Archiver(app_config)
         state_manager = StateManager(app_config)
         resource_monitor = ResourceMonitor(app_config)
@@ -398,23 +431,111 @@ def process(
             logger.warning("No processable files found")
             return
 
+        click.echo(f"Found {len(file_metadata_list)} file(s) to process.")
+        logger.info(f"Found {len(file_metadata_list)} files to process")
+
+        # Resume fast path: one bulk status lookup drops already-LOADED
+        # files before the loop, instead of paying per-file echo/log/status
+        # overhead just to skip them
+        statuses = state_manager.get_status_bulk(
+            [fm.get("file_id") or fm.get("hash") for fm in file_metadata_list]
+        )
+        to_process = [
+            fm
+            for fm in file_metadata_list
+            if statuses.get(fm.get("file_id") or fm.get("hash")) != "LOADED"
+        ]
+        skipped_loaded = len(file_metadata_list) - len(to_process)
+        if skipped_loaded:
+            click.secho(
+                f"Skipping {skipped_loaded} already-LOADED file(s).", fg="green"
+            )
+            logger.info(f"Skipped {skipped_loaded} already-loaded files")
+        file_metadata_list = to_process
         total_files = len(file_metadata_list)
-        click.echo(f"Found {total_files} file(s) to process.")
-        logger.info(f"Found {total_files} files to process")
 
         # B. Main Processing Loop (Resumption Logic Applied Here)
         success_count = 0
         error_count = 0
 
+        # Producer/consumer overlap: a small prefetch pool parses and chunks
+        # upcoming files while the main thread embeds and upserts the current
+        # one, so the embedder no longer sits idle during I/O-bound chunking.
+        # The bounded lookahead caps how many files' chunks are resident.
+        # Batch manifest checkpointing: state transitions inside the loop are
+        # applied in memory and flushed every few files instead of rewriting
+        # the manifest twice per file; atexit keeps resumability on Ctrl-C.
+        import atexit
+
+        state_flush_interval = 50
+        atexit.register(state_manager.flush)
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        parallel_config = app_config.get("parallel_processing", {})
+        chunk_executor = None
+        chunk_futures = {}
+        if parallel_config.get("enable_parallel_files", True) and total_files > 1:
+            chunk_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="eless-chunk-prefetch"
+            )
+
+        # Connector upserts are network/disk bound and run with the GIL
+        # released, so fan each batch out across databases concurrently
+        db_executor = None
+        if parallel_config.get("enable_parallel_database", True) and len(db_connectors) > 1:
+            db_executor = ThreadPoolExecutor(
+                max_workers=len(db_connectors), thread_name_prefix="eless-db-upsert"
+            )
+
+        import numpy as np
+
+        # Vectors travel the loop as one contiguous matrix (float16 when
+        # embedding.fp16 is set); the Python-list round-trip is only paid
+        # per batch when some active connector cannot take ndarray rows
+        vector_dtype = (
+            np.float16 if app_config.get("embedding", {}).get("fp16") else np.float32
+        )
+        ndarray_capable = all(
+            getattr(connector, "accepts_ndarray", False)
+            for connector in db_connectors.values()
+        )
+
+        def _needs_chunking(meta):
+            meta_id = meta.get("file_id") or meta.get("hash")
+            meta_status = state_manager.get_status(meta_id)
+            return meta_status == "PENDING" or (
+                meta_status == "EMBEDDED" and not resume
+            )
+
+        def _prefetch_chunks(next_index, lookahead=2):
+            """Queue parse_and_chunk jobs for the next few files needing it."""
+            if chunk_executor is None:
+                return
+            for meta in file_metadata_list[next_index : next_index + lookahead]:
+                meta_id = meta.get("file_id") or meta.get("hash")
+                if meta_id not in chunk_futures and _needs_chunking(meta):
+                    chunk_futures[meta_id] = chunk_executor.submit(
+                        dispatcher.parse_and_chunk, Path(str(meta["path"])), meta
+                    )
+
+        _prefetch_chunks(0)
+
         for i, file_meta in enumerate(file_metadata_list):
             file_id = file_meta.get("file_id") or file_meta.get(
                 "hash"
             )  # Support both formats
             file_path = str(file_meta["path"])
+            # Wrap the path and take the basename once per file; these were
+            # recomputed several times each inside the loop body
+            path_obj = Path(file_path)
+            basename = path_obj.name
             status = state_manager.get_status(file_id)
+            # Keep the prefetch window full before blocking on this file
+            _prefetch_chunks(i + 1)
 
             click.echo(
-                f"\n--- Processing File {i+1}/{total_files}: {os.path.basename(file_path)} (Status: {status}) ---"
+                f"\n--- Processing File {i+1}/{total_files}: {basename} (Status: {status}) ---"
             )
             logger.info(
                 f"Processing file {i+1}/{total_files}: {file_path} (Status: {status})"
@@ -432,13 +553,17 @@ def process(
                     logger.debug(f"Starting chunking for file: {file_path}")
 
                     # Check memory before processing
-                    estimated_memory = dispatcher.get_memory_estimate(Path(file_path))
+                    estimated_memory = dispatcher.get_memory_estimate(path_obj)
                     logger.info(
-                        f"Estimated memory for {os.path.basename(file_path)}: {estimated_memory:.1f}MB"
+                        f"Estimated memory for {basename}: {estimated_memory:.1f}MB"
                     )
 
-                    chunks = dispatcher.parse_and_chunk(Path(file_path), file_meta)
-                    state_manager.add_or_update_file(
+                    prefetched = chunk_futures.pop(file_id, None)
+                    if prefetched is not None:
+                        chunks = prefetched.result()
+                    else:
+                        chunks = dispatcher.parse_and_chunk(path_obj, file_meta)
+                    state_manager.add_or_update_file_deferred(
                         file_id, "CHUNKED", file_path=file_path
                     )
                 elif status == "EMBEDDED" and resume:
@@ -486,15 +611,12 @@ def process(
                             error_count += 1
                             continue
 
-                        # Extract vectors for database loading
-                        vectors = [
-                            (
-                                chunk["vector"].tolist()
-                                if hasattr(chunk["vector"], "tolist")
-                                else chunk["vector"]
-                            )
-                            for chunk in embedded_chunks
-                        ]
+                        # One contiguous matrix end-to-end; per-batch slices
+                        # below are views, not copies
+                        vectors = np.ascontiguousarray(
+                            np.stack([chunk["vector"] for chunk in embedded_chunks]),
+                            dtype=vector_dtype,
+                        )
                         chunks = embedded_chunks  # Update chunks with vectors
 
                         click.secho("Embedding successful and cached.", fg="cyan")
@@ -508,10 +630,8 @@ def process(
                     # Load cached vectors
                     cached_vectors = archiver.load_vectors(file_id)
                     if cached_vectors is not None:
-                        vectors = (
-                            cached_vectors.tolist()
-                            if hasattr(cached_vectors, "tolist")
-                            else cached_vectors
+                        vectors = np.ascontiguousarray(
+                            cached_vectors, dtype=vector_dtype
                         )
                         logger.info(
                             f"Loaded {len(vectors)} cached vectors for {file_path}"
@@ -526,47 +646,98 @@ def process(
                 click.echo(f"Loading vectors into {len(db_connectors)} database(s)...")
                 logger.info(f"Loading vectors into {len(db_connectors)} databases")
 
-                all_success = True
-                for name, connector in db_connectors.items():
-                    try:
-                        # Create batch data for upsert
-                        batch_data = []
-                        for idx, (chunk, vector) in enumerate(zip(chunks, vectors)):
-                            batch_data.append(
-                                {
-                                    "id": f"{file_id}_{idx}",
-                                    "vector": vector,
-                                    "metadata": {
-                                        "file_id": file_id,
-                                        "file_path": str(file_path),
-                                        "chunk_index": idx,
-                                        "text": chunk["text"][
-                                            :200
-                                        ],  # Truncated text for metadata
-                                        **chunk.get("metadata", {}),
-                                    },
-                                }
-                            )
-
-                        connector.upsert_batch(batch_data)
+                # Fused micro-batches: convert vectors, build records and
+                # upsert db_batch_size chunks at a time, dropping each
+                # payload before the next slice. Same work as embedding the
+                # whole file then loading it, but peak memory stays O(batch)
+                # instead of holding the full vector matrix as ndarray plus
+                # list-of-lists plus per-connector payloads simultaneously.
+                db_batch_size = app_config["databases"].get("batch_size", 100)
+                # Record IDs are pure functions of file_id and position, so
+                # format them once per file instead of inside the batch loop
+                chunk_ids = [f"{file_id}_{i}" for i in range(len(chunks))]
+                # Truncated metadata previews likewise never change per file
+                chunk_previews = [c["text"][:200] for c in chunks]
+
+                # Specialize the record builder once per file: file_id and
+                # file_path are bound here instead of re-read per record.
+                # Every connector in the registry consumes this same schema
+                # (reshaping internally where needed), so one builder serves
+                # all of them and batches stay shareable across connectors.
+                def build_record(idx, chunk, vector, _fid=file_id, _fpath=file_path):
+                    return {
+                        "id": chunk_ids[idx],
+                        "vector": vector,
+                        "metadata": {
+                            "file_id": _fid,
+                            "file_path": _fpath,
+                            "chunk_index": idx,
+                            "text": chunk_previews[idx],  # Truncated for metadata
+                            **chunk.get("metadata", {}),
+                        },
+                    }
+
+                failed_connectors = set()
+                for start in range(0, len(chunks), db_batch_size):
+                    stop = start + db_batch_size
+                    batch_vectors = vectors[start:stop]
+                    if not ndarray_capable and hasattr(batch_vectors, "tolist"):
+                        # Single C-level conversion pass for the whole slice
+                        batch_vectors = batch_vectors.tolist()
+                    # Every connector gets the same records, so build them
+                    # once per slice rather than once per database
+                    batch_data = [
+                        build_record(idx, chunk, vector)
+                        for idx, (chunk, vector) in enumerate(
+                            zip(chunks[start:stop], batch_vectors), start
+                        )
+                    ]
+                    if db_executor is not None:
+                        upsert_futures = {
+                            db_executor.submit(connector.upsert_batch, batch_data): name
+                            for name, connector in db_connectors.items()
+                            if name not in failed_connectors
+                        }
+                        for future in as_completed(upsert_futures):
+                            name = upsert_futures[future]
+                            try:
+                                future.result()
+                            except Exception as db_e:
+                                click.secho(
+                                    f"    [FAIL] Failed to load into {name}: {db_e}",
+                                    fg="red",
+                                )
+                                logger.error(f"Failed to load into {name}: {db_e}")
+                                failed_connectors.add(name)
+                    else:
+                        for name, connector in db_connectors.items():
+                            if name in failed_connectors:
+                                continue
+                            try:
+                                connector.upsert_batch(batch_data)
+                            except Exception as db_e:
+                                click.secho(
+                                    f"    [FAIL] Failed to load into {name}: {db_e}",
+                                    fg="red",
+                                )
+                                logger.error(f"Failed to load into {name}: {db_e}")
+                                failed_connectors.add(name)
+
+                all_success = not failed_connectors
+                for name in db_connectors:
+                    if name not in failed_connectors:
                         click.secho(
                             f"    [OK] Loaded successfully into {name}", fg="green"
                         )
                         logger.info(f"Successfully loaded into {name}")
-                    except Exception as db_e:
-                        click.secho(
-                            f"    [FAIL] Failed to load into {name}: {db_e}", fg="red"
-                        )
-                        logger.error(f"Failed to load into {name}: {db_e}")
-                        all_success = False
 
                 # Final Checkpoint
                 if all_success:
-                    state_manager.add_or_update_file(
+                    state_manager.add_or_update_file_deferred(
                         file_id, "LOADED", file_path=file_path
                     )
                     click.secho(
-                        f"File {os.path.basename(file_path)} successfully LOADED.",
+                        f"File {basename} successfully LOADED.",
                         fg="green",
                     )
                     logger.info(f"File successfully loaded: {file_path}")
@@ -579,10 +750,43 @@ def process(
                 click.secho(f"Error processing {file_path}: {e}", fg="red")
                 logger.error(f"Error processing {file_path}: {e}", exc_info=True)
                 error_count += 1
+                # If this file errored before consuming its prefetched
+                # chunking job, retire the future so shutdown cannot block
+                # on it and its own failure is not silently dropped
+                leftover = chunk_futures.pop(file_id, None)
+                if leftover is not None and not leftover.cancel():
+                    try:
+                        leftover.result()
+                    except Exception as prefetch_e:
+                        logger.warning(
+                            f"Prefetched chunking for {file_path} failed: {prefetch_e}"
+                        )
+
+            if (i + 1) % state_flush_interval == 0:
+                state_manager.flush()
+
+        state_manager.flush()
+        if chunk_executor is not None:
+            # Drain any prefetch jobs the loop never consumed (skipped or
+            # errored files) before shutting the pool down
+            for leftover_id, leftover in chunk_futures.items():
+                if not leftover.cancel():
+                    try:
+                        leftover.result()
+                    except Exception as prefetch_e:
+                        logger.warning(
+                            f"Prefetched chunking for {leftover_id[:8]} failed: {prefetch_e}"
+                        )
+            chunk_futures.clear()
+            chunk_executor.shutdown(wait=True)
+        if db_executor is not None:
+            db_executor.shutdown(wait=True)
 
         # Final summary
         click.echo(f"\n=== Processing Complete ===")
         click.echo(f"Total files: {total_files}")
+        if skipped_loaded:
+            click.secho(f"Skipped (already loaded): {skipped_loaded}", fg="green")
         click.secho(f"Successful: {success_count}", fg="green")
         if error_count > 0:
             click.secho(f"Errors: {error_count}", fg="red")
@@ -616,38 +820,14 @@ def process(
 def status(ctx, file_id, all, config):
     """Checks the processing status of files."""
     try:
-        config_path = (
-            Path(config)
-            if config
-            else (Path(DEFAULT_CONFIG_PATH) if DEFAULT_CONFIG_PATH else None)
-        )
+        config_path = Path(config) if config else _DEFAULT_CONFIG_PATH_OBJ
         config_loader = ConfigLoader(config_path)
-        cli_overrides = {}
-        if ctx.obj.get("log_level"):
-            cli_overrides["logging"] = {"level": ctx.obj["log_level"]}
-        if ctx.obj.get("log_dir"):
-            cli_overrides["logging"] = cli_overrides.get("logging", {})
-            cli_overrides["logging"]["directory"] = ctx.obj["log_dir"]
-        if ctx.obj.get("cache_dir"):
-            cli_overrides["cache"] = {"directory": ctx.obj["cache_dir"]}
-        if ctx.obj.get("data_dir"):
-            # Apply data_dir overrides similar to process command
-            data_dir = ctx.obj["data_dir"]
-            if "logging" not in cli_overrides:
-                cli_overrides["logging"] = {}
-            if "cache" not in cli_overrides:
-                cli_overrides["cache"] = {}
-
-            if not ctx.obj.get("log_dir"):
-                cli_overrides["logging"]["directory"] = str(
-                    Path(data_dir) / ".eless_logs"
-                )
-            if not ctx.obj.get("cache_dir"):
-                cli_overrides["cache"]["directory"] = str(
-                    Path(data_dir) / ".eless_cache"
-                )
+        cli_overrides = apply_ctx_overrides(ctx, {})
 
         app_config = config_loader.get_final_config(None, **cli_overrides)
+
+        from eless.core.state_manager import StateManager
+
         state_manager = StateManager(app_config)
 
         if all:
@@ -746,36 +926,9 @@ def status(ctx, file_id, all, config):
 def test(ctx, config, test_db):
     """Test database connections and system components."""
     try:
-        config_path = (
-            Path(config)
-            if config
-            else (Path(DEFAULT_CONFIG_PATH) if DEFAULT_CONFIG_PATH else None)
-        )
+        config_path = Path(config) if config else _DEFAULT_CONFIG_PATH_OBJ
         config_loader = ConfigLoader(config_path)
-        cli_overrides = {}
-        if ctx.obj.get("log_level"):
-            cli_overrides["logging"] = {"level": ctx.obj["log_level"]}
-        if ctx.obj.get("log_dir"):
-            cli_overrides["logging"] = cli_overrides.get("logging", {})
-            cli_overrides["logging"]["directory"] = ctx.obj["log_dir"]
-        if ctx.obj.get("cache_dir"):
-            cli_overrides["cache"] = {"directory": ctx.obj["cache_dir"]}
-        if ctx.obj.get("data_dir"):
-            # Apply data_dir overrides
-            data_dir = ctx.obj["data_dir"]
-            if "logging" not in cli_overrides:
-                cli_overrides["logging"] = {}
-            if "cache" not in cli_overrides:
-                cli_overrides["cache"] = {}
-
-            if not ctx.obj.get("log_dir"):
-                cli_overrides["logging"]["directory"] = str(
-                    Path(data_dir) / ".eless_logs"
-                )
-            if not ctx.obj.get("cache_dir"):
-                cli_overrides["cache"]["directory"] = str(
-                    Path(data_dir) / ".eless_cache"
-                )
+        cli_overrides = apply_ctx_overrides(ctx, {})
 
         app_config = config_loader.get_final_config(None, **cli_overrides)
 
@@ -817,6 +970,7 @@ def test(ctx, config, test_db):
 
         try:
             from eless.database.db_loader import DatabaseLoader
+            from eless.core.state_manager import StateManager
 
             state_manager = StateManager(app_config)
             db_loader = DatabaseLoader(app_config, state_manager, embedding_model)
@@ -884,52 +1038,39 @@ def logs(ctx, config, days):
     """Manage log files."""
     try:
         # Use provided config file or fall back to embedded defaults
-        config_path = (
-            Path(config)
-            if config
-            else (Path(DEFAULT_CONFIG_PATH) if DEFAULT_CONFIG_PATH else None)
-        )
+        config_path = Path(config) if config else _DEFAULT_CONFIG_PATH_OBJ
         config_loader = ConfigLoader(config_path)
-        cli_overrides = {}
-        if ctx.obj.get("log_level"):
-            cli_overrides["logging"] = {"level": ctx.obj["log_level"]}
-        if ctx.obj.get("log_dir"):
-            cli_overrides["logging"] = cli_overrides.get("logging", {})
-            cli_overrides["logging"]["directory"] = ctx.obj["log_dir"]
-        if ctx.obj.get("cache_dir"):
-            cli_overrides["cache"] = {"directory": ctx.obj["cache_dir"]}
-        if ctx.obj.get("data_dir"):
-            # Apply data_dir overrides
-            data_dir = ctx.obj["data_dir"]
-            if "logging" not in cli_overrides:
-                cli_overrides["logging"] = {}
-
-            if not ctx.obj.get("log_dir"):
-                cli_overrides["logging"]["directory"] = str(
-                    Path(data_dir) / ".eless_logs"
-                )
+        cli_overrides = apply_ctx_overrides(ctx, {})
 
         app_config = config_loader.get_final_config(None, **cli_overrides)
 
         # Setup logging to get log directory
         eless_logger = setup_logging(app_config)
 
-        # Show log files
-        log_files = eless_logger.get_log_files()
-        if log_files:
+        # Show log files: one scandir pass collects name, size and mtime
+        # from each entry's cached stat instead of two stat syscalls per file
+        import fnmatch
+
+        log_entries = []
+        with os.scandir(eless_logger.log_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and fnmatch.fnmatch(entry.name, "*.log*"):
+                    st = entry.stat()
+                    log_entries.append((entry.name, st.st_size, st.st_mtime))
+        log_entries.sort()
+
+        if log_entries:
             click.echo("\n=== Log Files ===")
             total_size = 0
-            for log_file in sorted(log_files):
-                size = log_file.stat().st_size
+            for name, size, modified_time in log_entries:
                 total_size += size
                 size_mb = size / (1024 * 1024)
-                modified_time = log_file.stat().st_mtime
-                import datetime
-
-                mod_date = datetime.datetime.fromtimestamp(modified_time).strftime(
-                    "%Y-%m-%d %H:%M:%S"
+                # time.strftime over the localtime struct skips building a
+                # datetime object just to format a timestamp
+                mod_date = time.strftime(
+                    "%Y-%m-%d %H:%M:%S", time.localtime(modified_time)
                 )
-                click.echo(f"{log_file.name:<20} | {size_mb:>6.2f} MB | {mod_date}")
+                click.echo(f"{name:<20} | {size_mb:>6.2f} MB | {mod_date}")
 
             click.echo(f"\nTotal log size: {total_size / (1024 * 1024):.2f} MB")
 
@@ -960,17 +1101,15 @@ def config_info(ctx, config):
     """Show current configuration information."""
     try:
         # Use provided config file or fall back to embedded defaults
-        config_path = (
-            Path(config)
-            if config
-            else (Path(DEFAULT_CONFIG_PATH) if DEFAULT_CONFIG_PATH else None)
-        )
+        config_path = Path(config) if config else _DEFAULT_CONFIG_PATH_OBJ
         config_loader = ConfigLoader(config_path)
         app_config = config_loader.get_final_config()
 
-        click.echo("=== ELESS Configuration ===")
+        # Assemble the report into one buffer and emit it with a single
+        # echo; per-line echoes each resolve tty state and issue a write
+        out = ["=== ELESS Configuration ==="]
         config_source = str(config_path) if config_path else "Embedded defaults"
-        click.echo(f"Config source: {config_source}")
+        out.append(f"Config source: {config_source}")
 
         # Show key configuration sections
         sections = {
@@ -985,15 +1124,16 @@ def config_info(ctx, config):
         }
 
         for section_name, section_config in sections.items():
-            click.echo(f"\n{section_name}:")
+            out.append(f"\n{section_name}:")
             for key, value in section_config.items():
                 if isinstance(value, list):
-                    click.echo(f"  {key}: {', '.join(str(v) for v in value)}")
+                    out.append(f"  {key}: {', '.join(str(v) for v in value)}")
                 else:
-                    click.echo(f"  {key}: {value}")
+                    out.append(f"  {key}: {value}")
 
         # Show available databases
-        click.echo(f"\nAvailable Databases: {', '.join(AVAILABLE_DATABASES)}")
+        out.append(f"\nAvailable Databases: {', '.join(AVAILABLE_DATABASES)}")
+        click.echo("\n".join(out))
 
     except Exception as e:
         click.secho(f"Error reading configuration: {e}", fg="red")
@@ -1015,25 +1155,9 @@ def cache(ctx, config, stats, cleanup, evict, clear):
     """Manage cache files and storage."""
     try:
         # Load configuration with directory overrides
-        config_path = (
-            Path(config)
-            if config
-            else (Path(DEFAULT_CONFIG_PATH) if DEFAULT_CONFIG_PATH else None)
-        )
+        config_path = Path(config) if config else _DEFAULT_CONFIG_PATH_OBJ
         config_loader = ConfigLoader(config_path)
-        cli_overrides = {}
-
-        # Apply directory overrides
-        if ctx.obj.get("cache_dir"):
-            cli_overrides["cache"] = {"directory": ctx.obj["cache_dir"]}
-        if ctx.obj.get("data_dir"):
-            data_dir = ctx.obj["data_dir"]
-            if "cache" not in cli_overrides:
-                cli_overrides["cache"] = {}
-            if not ctx.obj.get("cache_dir"):
-                cli_overrides["cache"]["directory"] = str(
-                    Path(data_dir) / ".eless_cache"
-                )
+        cli_overrides = apply_ctx_overrides(ctx, {})
 
         app_config = config_loader.get_final_config(None, **cli_overrides)
 
@@ -1097,9 +1221,10 @@ def cache(ctx, config, stats, cleanup, evict, clear):
                 click.echo("Cache clear cancelled")
 
         else:
-            # Default: show stats and perform auto-maintenance
+            # Default: show stats and perform auto-maintenance. The quick
+            # scan skips transient subtrees; good enough for an overview.
             click.echo("=== Cache Management ===")
-            stats_data = cache_mgr.get_cache_stats()
+            stats_data = cache_mgr.get_cache_stats(fast=True)
             click.echo(
                 f"Cache: {stats_data['size_mb']:.1f}MB/{stats_data['max_size_mb']}MB ({stats_data['utilization_percent']:.1f}%)"
             )
@@ -1161,7 +1286,6 @@ def init(ctx, preset, output):
     """Generate preset configuration for different system types."""
     try:
         from eless.core.config_wizard import generate_preset_config
-        import yaml
 
         config_dict = generate_preset_config(preset)
         output_path = Path(output)
@@ -1170,7 +1294,14 @@ def init(ctx, preset, output):
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(output_path, "w") as f:
-            yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+            yaml.dump(
+                config_dict,
+                f,
+                Dumper=YAML_SAFE_DUMPER,
+                default_flow_style=False,
+                indent=2,
+                sort_keys=False,
+            )
 
         click.echo(f"✨ Generated {preset} configuration: {output_path}")
         click.echo(f"\nTo use this configuration:")
@@ -1186,12 +1317,11 @@ def init(ctx, preset, output):
 def validate(ctx, config_file):
     """Validate a configuration file."""
     try:
-        import yaml
-        from pathlib import Path
+        from eless.core.config_loader import YAML_SAFE_LOADER
 
         # Load and parse config
         with open(config_file, "r") as f:
-            config_dict = yaml.safe_load(f)
+            config_dict = yaml.load(f, Loader=YAML_SAFE_LOADER)
 
         # Basic structure validation
         required_sections = ["cache", "logging", "embedding", "chunking", "databases"]
@@ -1213,14 +1343,26 @@ def validate(ctx, config_file):
             config_dict.get("logging", {}).get("directory"),
         ]
 
-        for path_str in paths_to_check:
-            if path_str:
-                path = Path(path_str)
-                try:
-                    path.mkdir(parents=True, exist_ok=True)
+        # Fan the mkdirs out to a small pool: each one is several syscalls,
+        # and on network mounts they are round-trip bound. The GIL is
+        # released around syscalls, so the pool overlaps the latency.
+        from concurrent.futures import ThreadPoolExecutor
+
+        def ensure_dir(path_str):
+            path = Path(path_str)
+            try:
+                path.mkdir(parents=True, exist_ok=True)
+                return path, None
+            except Exception as e:
+                return path, e
+
+        valid_paths = [p for p in paths_to_check if p]
+        with ThreadPoolExecutor(max_workers=min(8, len(valid_paths) or 1)) as pool:
+            for path, error in pool.map(ensure_dir, valid_paths):
+                if error is None:
                     click.secho(f"[OK] Path validated: {path}", fg="green")
-                except Exception as e:
-                    click.secho(f"[ERROR] Path error {path}: {e}", fg="red")
+                else:
+                    click.secho(f"[ERROR] Path error {path}: {error}", fg="red")
 
         # Check numeric ranges
         batch_size = config_dict.get("embedding", {}).get("batch_size", 32)
@@ -1255,7 +1397,6 @@ def auto_detect(ctx, output):
     """Auto-detect optimal configuration for current system."""
     try:
         import psutil
-        import yaml
 
         # Detect system resources
         memory_gb = psutil.virtual_memory().total / (1024**3)
@@ -1295,7 +1436,14 @@ def auto_detect(ctx, output):
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(output_path, "w") as f:
-            yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+            yaml.dump(
+                config_dict,
+                f,
+                Dumper=YAML_SAFE_DUMPER,
+                default_flow_style=False,
+                indent=2,
+                sort_keys=False,
+            )
 
         click.echo(f"✨ Auto-generated configuration saved to: {output_path}")
         click.echo(f"\nKey settings:")
@@ -1330,15 +1478,8 @@ def auto_detect(ctx, output):
 def monitor(ctx, config, interval, duration):
     """Real-time system monitoring for ELESS processing."""
     try:
-        import time
-        from datetime import datetime
-
         # Load configuration
-        config_path = (
-            Path(config)
-            if config
-            else (Path(DEFAULT_CONFIG_PATH) if DEFAULT_CONFIG_PATH else None)
-        )
+        config_path = Path(config) if config else _DEFAULT_CONFIG_PATH_OBJ
         config_loader = ConfigLoader(config_path)
         app_config = config_loader.get_final_config()
 
@@ -1352,106 +1493,151 @@ def monitor(ctx, config, interval, duration):
         click.echo("\n🖥️  ELESS System Monitor")
         click.echo("Press Ctrl+C to stop\n")
 
-        start_time = time.time()
+        # Hot-loop locals: bound methods skip the module attribute lookups,
+        # and time.strftime over a struct avoids building a tz-aware
+        # datetime per frame just to format a timestamp.
+        _time = time.time
+        _strf = time.strftime
+        _local = time.localtime
+
+        start_time = _time()
+        last_frame_key = None
 
         while True:
-            # Clear screen (works on most terminals)
-            click.echo("\033[2J\033[H", nl=False)
+            now = _time()
+            summary = resource_monitor.get_system_summary()
+            cache_stats = cache_manager.get_cache_stats(fast=True)
+
+            # Skip the redraw when nothing the frame shows has changed
+            # (the header clock is allowed to lag); rewriting an identical
+            # screen is pure terminal traffic.
+            frame_key = (
+                round(summary["memory_percent"], 1),
+                round(summary["cpu_percent"], 1),
+                round(summary["disk_usage_percent"], 1),
+                summary["should_throttle"],
+                summary["recommended_batch_size"],
+                round(cache_stats["size_mb"], 1),
+                cache_stats["file_count"],
+            )
+            if frame_key == last_frame_key:
+                time.sleep(interval)
+                if duration > 0 and (_time() - start_time) >= duration:
+                    break
+                continue
+            last_frame_key = frame_key
 
-            # Header
-            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            elapsed = int(time.time() - start_time)
-            click.echo(f"ELESS Monitor - {current_time} (Running: {elapsed}s)")
-            click.echo("=" * 60)
+            # Assemble the whole frame in one buffer so a redraw is a
+            # single write + flush instead of ~20 echo syscalls; colors go
+            # through click.style into the buffer
+            current_time = _strf("%Y-%m-%d %H:%M:%S", _local(now))
+            elapsed = int(now - start_time)
+            # Clear screen (works on most terminals)
+            frame = [
+                "\033[2J\033[H"
+                + f"ELESS Monitor - {current_time} (Running: {elapsed}s)",
+                "=" * 60,
+            ]
 
             # System Resources
-            summary = resource_monitor.get_system_summary()
-            click.echo("\n📊 System Resources:")
+            frame.append("\n📊 System Resources:")
 
             # Memory status with color
-            memory_color = (
-                "red"
-                if summary["memory_percent"] > 90
-                else "yellow" if summary["memory_percent"] > 80 else "green"
-            )
-            click.secho(
-                f"   Memory: {summary['memory_percent']:.1f}% ({summary['memory_pressure']}) - {summary['memory_available_mb']:.0f}MB free",
-                fg=memory_color,
+            memory_color = _status_color(summary["memory_percent"])
+            frame.append(
+                click.style(
+                    f"   Memory: {summary['memory_percent']:.1f}% ({summary['memory_pressure']}) - {summary['memory_available_mb']:.0f}MB free",
+                    fg=memory_color,
+                )
             )
 
             # CPU status
-            cpu_color = (
-                "red"
-                if summary["cpu_percent"] > 90
-                else "yellow" if summary["cpu_percent"] > 80 else "green"
-            )
-            click.secho(
-                f"   CPU: {summary['cpu_percent']:.1f}% - Trend: {summary['cpu_trend']}",
-                fg=cpu_color,
+            cpu_color = _status_color(summary["cpu_percent"])
+            frame.append(
+                click.style(
+                    f"   CPU: {summary['cpu_percent']:.1f}% - Trend: {summary['cpu_trend']}",
+                    fg=cpu_color,
+                )
             )
 
             # Disk usage
-            disk_color = (
-                "red"
-                if summary["disk_usage_percent"] > 90
-                else "yellow" if summary["disk_usage_percent"] > 80 else "green"
-            )
-            click.secho(
-                f"   Disk: {summary['disk_usage_percent']:.1f}% used", fg=disk_color
+            disk_color = _status_color(summary["disk_usage_percent"])
+            frame.append(
+                click.style(
+                    f"   Disk: {summary['disk_usage_percent']:.1f}% used",
+                    fg=disk_color,
+                )
             )
 
             # Processing status
-            click.echo("\n⚙️  Processing Status:")
+            frame.append("\n⚙️  Processing Status:")
             if summary["should_throttle"]:
-                click.secho("   Status: THROTTLED - Resources constrained", fg="red")
+                frame.append(
+                    click.style("   Status: THROTTLED - Resources constrained", fg="red")
+                )
             else:
-                click.secho("   Status: READY - Resources available", fg="green")
+                frame.append(
+                    click.style("   Status: READY - Resources available", fg="green")
+                )
 
-            click.echo(
+            frame.append(
                 f"   Recommended batch size: {summary['recommended_batch_size']}"
             )
 
             # Cache status
-            cache_stats = cache_manager.get_cache_stats()
-            click.echo("\nDatabase: Cache Status:")
-            cache_color = (
-                "red"
-                if cache_stats["utilization_percent"] > 90
-                else "yellow" if cache_stats["utilization_percent"] > 75 else "green"
+            frame.append("\nDatabase: Cache Status:")
+            cache_color = _status_color(
+                cache_stats["utilization_percent"], thresholds=(75, 90)
             )
-            click.secho(
-                f"   Size: {cache_stats['size_mb']:.1f}MB / {cache_stats['max_size_mb']}MB ({cache_stats['utilization_percent']:.1f}%)",
-                fg=cache_color,
+            frame.append(
+                click.style(
+                    f"   Size: {cache_stats['size_mb']:.1f}MB / {cache_stats['max_size_mb']}MB ({cache_stats['utilization_percent']:.1f}%)",
+                    fg=cache_color,
+                )
             )
-            click.echo(
+            frame.append(
                 f"   Files: {cache_stats['file_count']} / {cache_stats['max_files']}"
             )
 
             # Performance recommendations
-            click.echo("\n[TIP] Recommendations:")
+            frame.append("\n[TIP] Recommendations:")
             if summary["memory_percent"] > 85:
-                click.secho(
-                    "   • Consider reducing batch size or clearing cache", fg="yellow"
+                frame.append(
+                    click.style(
+                        "   • Consider reducing batch size or clearing cache",
+                        fg="yellow",
+                    )
                 )
             if cache_stats["utilization_percent"] > 90:
-                click.secho(
-                    "   • Cache nearly full - run 'eless cache --evict'", fg="yellow"
+                frame.append(
+                    click.style(
+                        "   • Cache nearly full - run 'eless cache --evict'",
+                        fg="yellow",
+                    )
                 )
             if summary["cpu_percent"] > 90:
-                click.secho(
-                    "   • High CPU usage - consider pausing processing", fg="yellow"
+                frame.append(
+                    click.style(
+                        "   • High CPU usage - consider pausing processing",
+                        fg="yellow",
+                    )
                 )
             if summary["memory_percent"] < 50 and summary["cpu_percent"] < 50:
-                click.secho(
-                    "   • System resources available - can increase batch sizes",
-                    fg="green",
+                frame.append(
+                    click.style(
+                        "   • System resources available - can increase batch sizes",
+                        fg="green",
+                    )
                 )
 
+            sys.stdout.write("\n".join(frame) + "\n")
+            sys.stdout.flush()
+
             # Sleep or exit
             time.sleep(interval)
 
             # Check duration limit
-            if duration > 0 and (time.time() - start_time) >= duration:
+            if duration > 0 and (_time() - start_time) >= duration:
                 break
 
     except KeyboardInterrupt:
@@ -1479,35 +1665,9 @@ def version(ctx):
 def resume(ctx, config):
     """Resume processing from the last checkpoint."""
     try:
-        config_path = (
-            Path(config)
-            if config
-            else (Path(DEFAULT_CONFIG_PATH) if DEFAULT_CONFIG_PATH else None)
-        )
+        config_path = Path(config) if config else _DEFAULT_CONFIG_PATH_OBJ
         config_loader = ConfigLoader(config_path)
-        cli_overrides = {}
-        if ctx.obj.get("log_level"):
-            cli_overrides["logging"] = {"level": ctx.obj["log_level"]}
-        if ctx.obj.get("log_dir"):
-            cli_overrides["logging"] = cli_overrides.get("logging", {})
-            cli_overrides["logging"]["directory"] = ctx.obj["log_dir"]
-        if ctx.obj.get("cache_dir"):
-            cli_overrides["cache"] = {"directory": ctx.obj["cache_dir"]}
-        if ctx.obj.get("data_dir"):
-            data_dir = ctx.obj["data_dir"]
-            if "logging" not in cli_overrides:
-                cli_overrides["logging"] = {}
-            if "cache" not in cli_overrides:
-                cli_overrides["cache"] = {}
-
-            if not ctx.obj.get("log_dir"):
-                cli_overrides["logging"]["directory"] = str(
-                    Path(data_dir) / ".eless_logs"
-                )
-            if not ctx.obj.get("cache_dir"):
-                cli_overrides["cache"]["directory"] = str(
-                    Path(data_dir) / ".eless_cache"
-                )
+        cli_overrides = apply_ctx_overrides(ctx, {})
 
         app_config = config_loader.get_final_config(None, **cli_overrides)
 
@@ -1516,6 +1676,9 @@ def resume(ctx, config):
         logger = logging.getLogger("ELESS.CLI")
 
         # Initialize components
+        from eless.core.archiver import Archiver
+        from eless.core.state_manager import StateManager
+
         state_manager = StateManager(app_config)
         archiver = Archiver(app_config)
 
@@ -1627,7 +1790,14 @@ def init(preset):
             config_path = config_dir / "config.yaml"
 
             with open(config_path, "w") as f:
-                yaml.dump(config, f, default_flow_style=False, indent=2)
+                yaml.dump(
+                    config,
+                    f,
+                    Dumper=YAML_SAFE_DUMPER,
+                    default_flow_style=False,
+                    indent=2,
+                    sort_keys=False,
+                )
 
             click.secho(
                 f"\n[OK] Configuration saved to: {config_path}", fg="green", bold=True
@@ -1792,7 +1962,6 @@ def template(action, template_name, output):
             print_template_info,
             get_template,
         )
-        import yaml
 
         if action == "list":
             click.secho("\n📝 Available Templates:", fg="blue", bold=True)
@@ -1830,7 +1999,14 @@ def template(action, template_name, output):
 
             # Save configuration
             with open(output_path, "w") as f:
-                yaml.dump(config, f, default_flow_style=False, indent=2)
+                yaml.dump(
+                    config,
+                    f,
+                    Dumper=YAML_SAFE_DUMPER,
+                    default_flow_style=False,
+                    indent=2,
+                    sort_keys=False,
+                )
 
             click.secho(
                 f"\n[OK] Created configuration from '{template_name}' template:",
@@ -96,6 +96,26 @@ class Archiver:
             self.delete_archived_data(file_hash, "vectors")  # Clean up corrupted file
             return None
 
+    def list_cached_hashes(self) -> set:
+        """Returns the hashes that have any cached artifact on disk.
+
+        One scandir over the cache directory instead of probing (or worse,
+        deserializing) per hash; existence checks against the returned set
+        are O(1).
+        """
+        cached = set()
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith(".chunks.pkl"):
+                        cached.add(name[: -len(".chunks.pkl")])
+                    elif name.endswith(".vectors.npy"):
+                        cached.add(name[: -len(".vectors.npy")])
+        except OSError as e:
+            logger.error(f"Failed to list cache directory {self.cache_dir}: {e}")
+        return cached
+
     def validate_cache(self, file_hash: str) -> bool:
         """Validates that both chunks and vectors exist and are loadable for the file."""
         chunks = self.load_chunks(file_hash)
@@ -66,24 +66,53 @@ class SmartCacheManager:
         # Add to end (most recent)
         self.access_times[file_hash] = current_time
 
-    def get_cache_size_mb(self) -> float:
-        """Calculate current cache size in MB."""
+    # Top-level directories skipped by the fast scan: transient state that
+    # should not count against the cache budget anyway.
+    _FAST_SCAN_SKIP = frozenset({"tmp", "locks", ".git"})
+
+    def _scan_cache(self, fast: bool = False) -> Tuple[int, int]:
+        """Walk the cache once, returning (total_size_bytes, entry_count).
+
+        Uses os.scandir so each entry's cached stat serves both the size sum
+        and the count in a single pass, instead of the two rglob walks the
+        size and count accessors used to make. With ``fast`` the transient
+        top-level subtrees in ``_FAST_SCAN_SKIP`` are not descended into.
+        """
         total_size = 0
+        entry_count = 0
+        root = str(self.cache_dir)
+        stack = [root]
         try:
-            for file_path in self.cache_dir.rglob("*"):
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
+            while stack:
+                current = stack.pop()
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if (
+                                fast
+                                and current == root
+                                and entry.name in self._FAST_SCAN_SKIP
+                            ):
+                                continue
+                            entry_count += 1
+                            stack.append(entry.path)
+                        else:
+                            entry_count += 1
+                            if entry.is_file(follow_symlinks=False):
+                                total_size += entry.stat(follow_symlinks=False).st_size
         except OSError as e:
-            logger.warning(f"Error calculating cache size: {e}")
+            logger.warning(f"Error scanning cache: {e}")
+        return total_size, entry_count
+
+    def get_cache_size_mb(self) -> float:
+        """Calculate current cache size in MB."""
+        total_size, _ = self._scan_cache()
         return total_size / (1024 * 1024)
 
     def get_cache_file_count(self) -> int:
         """Count cache files."""
-        try:
-            return len(list(self.cache_dir.rglob("*")))
-        except OSError as e:
-            logger.warning(f"Error counting cache files: {e}")
-            return 0
+        _, entry_count = self._scan_cache()
+        return entry_count
 
     def should_evict(self) -> bool:
         """Check if cache eviction is needed."""
@@ -196,15 +225,22 @@ class SmartCacheManager:
 
         return corrupted
 
-    def get_cache_stats(self) -> Dict:
-        """Get comprehensive cache statistics."""
+    def get_cache_stats(self, fast: bool = False) -> Dict:
+        """Get comprehensive cache statistics.
+
+        Args:
+            fast: Skip transient top-level subtrees (tmp, locks) for a
+                quicker estimate; see _scan_cache.
+        """
+        total_size, entry_count = self._scan_cache(fast=fast)
+        size_mb = total_size / (1024 * 1024)
         return {
-            "size_mb": self.get_cache_size_mb(),
+            "size_mb": size_mb,
             "max_size_mb": self.max_size_mb,
-            "file_count": self.get_cache_file_count(),
+            "file_count": entry_count,
             "max_files": self.max_files,
             "tracked_accesses": len(self.access_times),
-            "utilization_percent": (self.get_cache_size_mb() / self.max_size_mb) * 100,
+            "utilization_percent": (size_mb / self.max_size_mb) * 100,
         }
 
     def clear_cache(self) -> bool:
@@ -1,27 +1,165 @@
 import yaml
 import os
+import copy
+import functools
+import mmap
 from typing import Dict, Any, Optional
 from pathlib import Path
 import logging
-from functools import reduce
-
 from .default_config import get_default_config
 
 logger = logging.getLogger("ELESS.Config")
 
+# Prefer the libyaml C parser/emitter when PyYAML was compiled against it;
+# identical semantics to SafeLoader/SafeDumper at a fraction of the cost.
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_SAFE_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+if YAML_SAFE_LOADER is yaml.SafeLoader:
+    # Once per process, so deployments notice the slow parser
+    logger.warning(
+        "PyYAML was built without libyaml; falling back to the pure-Python parser"
+    )
+
+# Files below one page aren't worth an mmap round-trip
+_MMAP_MIN_SIZE = 4096
+
+# CLI arguments get_final_config knows how to place: arg -> (section, key).
+# New CLI keys are added here declaratively; the shapes are static, so they
+# are applied as direct assignments instead of a generic merge.
+_CLI_ARG_PATHS = {
+    "chunk_size": ("chunking", "chunk_size"),
+}
+
+# Environment overrides: (variable, (section, key), cast). Table-driven so
+# load_config_with_env neither rebuilds the mapping nor branches per key.
+_ENV_MAPPING = (
+    ("ELESS_CACHE_DIR", ("cache", "directory"), str),
+    ("ELESS_DB_PATH", ("database", "path"), str),
+    ("ELESS_MAX_WORKERS", ("parallel_processing", "max_workers"), int),
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file, memoized by (path, mtime_ns, size).
+
+    Config files are static for the life of a process, so subcommands that
+    re-instantiate ConfigLoader skip the re-parse entirely; a changed file
+    gets a new mtime and therefore a fresh cache entry. Nanosecond mtime
+    resolution avoids stale hits on filesystems with coarse timestamps when
+    a file is rewritten within the same second, and the size guards the
+    remaining case of a same-length timestamp restore after an edit.
+    """
+    with open(path_str, "rb") as f:
+        # Parse big configs straight from mapped pages instead of copying
+        # them into Python buffers first; below a page the mmap setup costs
+        # more than it saves
+        if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                return yaml.load(mapped, Loader=YAML_SAFE_LOADER)
+            finally:
+                mapped.close()
+        return yaml.load(f, Loader=YAML_SAFE_LOADER)
+
 # --- Helper Functions for Deep Merging ---
 
 
 def deep_merge(target: Dict, source: Dict) -> Dict:
-    """Recursively merges source dictionary into target dictionary."""
-    for key, value in source.items():
-        if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-            deep_merge(target[key], value)
-        else:
-            target[key] = value
+    """Merges source dictionary into target dictionary, nested dicts deeply.
+
+    Iterative with an explicit stack of (target, source) pairs: config trees
+    are merged several times per CLI invocation, and walking them without
+    per-level Python frames is cheaper and immune to recursion limits.
+    """
+    if not source:
+        return target
+    stack = [(target, source)]
+    while stack:
+        tgt, src = stack.pop()
+        for key, value in src.items():
+            existing = tgt.get(key)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                if value:
+                    stack.append((existing, value))
+            else:
+                tgt[key] = value
     return target
 
 
+def cow_merge(base: Dict, override: Dict) -> Dict:
+    """Copy-on-write deep merge that mutates neither input.
+
+    Returns a new dict sharing every subtree of ``base`` that ``override``
+    does not touch; only the dicts along overridden paths are copied. Unlike
+    deep_merge, merging into a shared base (e.g. cached defaults) can never
+    write through into it.
+    """
+    if not override:
+        return base
+    merged = dict(base)
+    for key, value in override.items():
+        existing = base.get(key)
+        if isinstance(existing, dict) and isinstance(value, dict):
+            merged[key] = cow_merge(existing, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class LazyConfig:
+    """Deferred view over the merged configuration layers.
+
+    Holds the ingredients of a ``get_final_config`` call -- loader, user
+    config path, CLI arguments -- and performs no file I/O, parsing or
+    merging until a key is first accessed (or :meth:`materialize` is
+    called). Invocations that end up never reading the config skip the
+    user-YAML parse entirely.
+
+    The deferral is all-or-nothing: a key present in the defaults may
+    still be overridden by the user file, so answering any lookup from
+    the defaults alone without consulting the user layer would return
+    stale values. After the first access the wrapper just delegates to
+    the materialized dict.
+    """
+
+    __slots__ = ("_loader", "_user_config_path", "_cli_args", "_config")
+
+    def __init__(
+        self,
+        loader: "ConfigLoader",
+        user_config_path: Optional[str] = None,
+        cli_args: Optional[Dict[str, Any]] = None,
+    ):
+        self._loader = loader
+        self._user_config_path = user_config_path
+        self._cli_args = cli_args or {}
+        self._config: Optional[Dict[str, Any]] = None
+
+    def materialize(self) -> Dict[str, Any]:
+        """Resolve and return the merged config as a plain dict."""
+        if self._config is None:
+            self._config = self._loader.get_final_config(
+                self._user_config_path, **self._cli_args
+            )
+        return self._config
+
+    def __getitem__(self, key: str) -> Any:
+        return self.materialize()[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.materialize().get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.materialize()
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __len__(self) -> int:
+        return len(self.materialize())
+
+
 # --- Core Configuration Loader ---
 
 
@@ -30,8 +168,11 @@ class ConfigLoader:
 
     def __init__(self, default_config_path: Optional[Path] = None):
         self.default_config_path = default_config_path
-        if default_config_path and default_config_path.exists():
-            self._default_config = self._load_yaml_file(default_config_path)
+        loaded = (
+            self._load_yaml_file(default_config_path) if default_config_path else None
+        )
+        if loaded is not None:
+            self._default_config = loaded
             logger.info(f"Loaded configuration from: {default_config_path}")
         else:
             # Use embedded default configuration
@@ -43,18 +184,21 @@ class ConfigLoader:
             else:
                 logger.info("Using embedded default configuration")
 
-    def _load_yaml_file(self, path: Path) -> Dict[str, Any]:
-        """Loads a YAML file from a given path."""
+    def _load_yaml_file(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Loads a YAML file, or None when the file is missing or empty.
+
+        The open itself is the existence probe: callers pick their fallback
+        off the None return instead of racing an exists() stat against the
+        subsequent open.
+        """
         try:
-            with open(path, "r") as f:
-                return yaml.safe_load(f)
+            st = os.stat(path)
+            # Deep-copy so callers that merge/mutate never touch cache entries
+            return copy.deepcopy(
+                _load_yaml_cached(str(path), st.st_mtime_ns, st.st_size)
+            )
         except FileNotFoundError:
-            logger.error(f"Configuration file not found at: {path}")
-            if path == self.default_config_path:
-                raise FileNotFoundError(
-                    f"CRITICAL: Default configuration file missing at {path}"
-                )
-            return {}
+            return None
         except yaml.YAMLError as e:
             logger.error(f"Error parsing YAML file {path}: {e}")
             raise
@@ -69,38 +213,74 @@ class ConfigLoader:
         1. Default Config (Lowest Priority)
         2. User Custom Config File
         3. CLI Arguments (Highest Priority)
-        """
-
-        # 1. Start with a deep copy of the default config
-        final_config = self._default_config.copy()
 
-        # 2. Load and merge user config if provided
+        The layers are folded with the copy-on-write merge, so subtrees with
+        no override anywhere are shared from the defaults as-is; only dicts
+        along actually-overridden paths are materialized.
+        """
+        # Fast path for the common no-override call (logs, monitor,
+        # config_info without options): nothing to load or merge. The
+        # shallow copy keeps the cached defaults' top level safe from
+        # callers that assign into the returned dict.
+        if not user_config_path and not cli_args:
+            return self._default_config.copy()
+
+        # 1. Load the user config layer if provided
+        user_config = {}
         if user_config_path:
-            user_path = Path(user_config_path)
-            if user_path.exists():
-                user_config = self._load_yaml_file(user_path)
-                final_config = deep_merge(final_config, user_config)
+            loaded = self._load_yaml_file(Path(user_config_path))
+            if loaded is not None:
+                user_config = loaded
                 logger.info(f"Merged settings from user config: {user_config_path}")
             else:
                 logger.warning(
                     f"User config file not found at: {user_config_path}. Skipping merge."
                 )
 
-        # 3. Merge CLI Arguments (Highest Priority)
-        cli_overrides = {}
-        if cli_args:
-            if "chunk_size" in cli_args:
-                cli_overrides["chunking"] = {"chunk_size": cli_args["chunk_size"]}
+        # 2. Resolve defaults <- user config; cow_merge returns its base
+        # unchanged for an empty override, so an absent layer costs nothing
+        final_config = cow_merge(self._default_config, user_config)
+
+        # 3. Apply CLI arguments (Highest Priority) as direct assignments
+        # from the dispatch table; the override shapes are known statically,
+        # so there is nothing for a generic merge to discover
+        applied = False
+        for arg, (section, key) in _CLI_ARG_PATHS.items():
+            if arg in cli_args:
+                if final_config is self._default_config:
+                    final_config = dict(final_config)
+                # Copy the section before writing: it may be shared with
+                # the cached defaults
+                section_config = dict(final_config.get(section) or ())
+                section_config[key] = cli_args[arg]
+                final_config[section] = section_config
+                applied = True
+        if applied:
+            logger.info("Applied overrides from CLI arguments.")
+
+        if final_config is self._default_config:
+            # Nothing overrode anything: hand out a copy, not shared state
+            final_config = self._default_config.copy()
+        return final_config
 
-            final_config = deep_merge(final_config, cli_overrides)
-            if cli_overrides:
-                logger.info("Applied overrides from CLI arguments.")
+    def get_lazy_config(
+        self, user_config_path: Optional[str] = None, **cli_args
+    ) -> LazyConfig:
+        """Like get_final_config, but defers all loading and merging.
 
-        return final_config
+        Returns a :class:`LazyConfig` that resolves the layers on first
+        key access; useful for code paths that only conditionally read
+        the configuration.
+        """
+        return LazyConfig(self, user_config_path, cli_args)
 
     def load_config(self, config_path: Path) -> Dict[str, Any]:
         """Load configuration from a file."""
-        return self._load_yaml_file(config_path)
+        config = self._load_yaml_file(config_path)
+        if config is None:
+            logger.error(f"Configuration file not found at: {config_path}")
+            return {}
+        return config
 
     def validate_config(self, config: Dict[str, Any]) -> None:
         """Validate configuration values and relationships."""
@@ -128,6 +308,14 @@ class ConfigLoader:
             raise ValueError("embedding batch_size must be greater than 0")
         if "normalize" in embedding and not isinstance(embedding["normalize"], bool):
             raise TypeError("embedding.normalize must be a boolean")
+        if "storage_dtype" in embedding and embedding["storage_dtype"] not in [
+            "float32",
+            "float16",
+            "int8",
+        ]:
+            raise ValueError(
+                "embedding.storage_dtype must be 'float32', 'float16', or 'int8'"
+            )
 
         # Validate resource limits
         limits = config.get("resource_limits", {})
@@ -196,9 +384,12 @@ class ConfigLoader:
     def merge_configs(
         self, base_config: Dict[str, Any], override_config: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Merge two configurations with override taking precedence."""
-        merged = base_config.copy()
-        return deep_merge(merged, override_config)
+        """Merge two configurations with override taking precedence.
+
+        Copy-on-write: neither input is mutated, and subtrees without any
+        override are shared from base_config instead of being copied.
+        """
+        return cow_merge(base_config, override_config)
 
     def load_with_defaults(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Load configuration with default values for missing fields."""
@@ -213,21 +404,11 @@ class ConfigLoader:
         # Load base configuration
         config = self.load_config(config_path)
 
-        # Environment variable mapping
-        env_mapping = {
-            "ELESS_CACHE_DIR": ("cache", "directory"),
-            "ELESS_DB_PATH": ("database", "path"),
-            "ELESS_MAX_WORKERS": ("parallel_processing", "max_workers"),
-        }
-
-        # Apply environment variables
-        for env_var, (section, key) in env_mapping.items():
-            if env_var in os.environ:
-                if section not in config:
-                    config[section] = {}
-                if key == "max_workers":
-                    config[section][key] = int(os.environ[env_var])
-                else:
-                    config[section][key] = os.environ[env_var]
+        # Apply environment variables from the precompiled table
+        env = os.environ
+        for env_var, (section, key), cast in _ENV_MAPPING:
+            value = env.get(env_var)
+            if value is not None:
+                config.setdefault(section, {})[key] = cast(value)
 
         return config
@@ -6,6 +6,8 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 import logging
 
+from .config_loader import YAML_SAFE_DUMPER
+
 logger = logging.getLogger("ELESS.ConfigWizard")
 
 
@@ -391,7 +393,14 @@ class ConfigWizard:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(output_path, "w") as f:
-                yaml.dump(self.config, f, default_flow_style=False, indent=2)
+                yaml.dump(
+                    self.config,
+                    f,
+                    Dumper=YAML_SAFE_DUMPER,
+                    default_flow_style=False,
+                    indent=2,
+                    sort_keys=False,
+                )
 
             click.echo(f"\n Configuration saved to: {output_path}")
             click.echo("\nTo use this configuration:")
@@ -3,8 +3,9 @@
 This module provides default configuration values for the ELESS pipeline.
 """
 
-from typing import Dict, Any
-import copy
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+import pickle
 
 # Default configuration dictionary
 DEFAULT_CONFIG = {
@@ -29,6 +30,7 @@ DEFAULT_CONFIG = {
         "batch_size": 32,
         "normalize": True,
         "cache_embeddings": True,
+        "storage_dtype": "float32",  # float32 | float16 | int8 (storage/wire width)
         "model_path": None,
         "use_gpu": False,
         "quantize": False,
@@ -76,6 +78,7 @@ DEFAULT_CONFIG = {
     "databases": {
         "batch_size": 64,
         "default": {"drop_existing": False},
+        "query_cache": {"max_size": 256, "ttl_seconds": 300},
         "targets": [],  # Empty by default; users should add based on installed dependencies
         "connections": {
             "chroma": {"type": "chroma", "path": ".eless_chroma"},
@@ -115,10 +118,34 @@ DEFAULT_CONFIG = {
 }
 
 
+# Serialized once at import: materializing a copy from this blob is several
+# times faster than copy.deepcopy-ing the dict -- and also beats a
+# specialized recursive dict/list cloner, which pays a Python frame per
+# node where the unpickler loops in C. The defaults are plain JSON-style
+# data, so the round-trip is lossless.
+_DEFAULT_CONFIG_PICKLE = pickle.dumps(DEFAULT_CONFIG, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _freeze(value):
+    """Recursively wrap dicts in read-only proxies and lists in tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# The exported master is deep-frozen after the pickle blob is taken from the
+# raw literal: any write to it, at any depth, raises immediately instead of
+# silently poisoning every future copy.
+DEFAULT_CONFIG: Mapping[str, Any] = _freeze(DEFAULT_CONFIG)
+
+
 def get_default_config() -> Dict[str, Any]:
     """Get default configuration values for ELESS pipeline.
 
     Returns:
-        Dict[str, Any]: Default configuration dictionary
+        Dict[str, Any]: Default configuration dictionary (a fresh mutable
+        deep copy; callers are free to modify it)
     """
-    return copy.deepcopy(DEFAULT_CONFIG)
+    return pickle.loads(_DEFAULT_CONFIG_PICKLE)
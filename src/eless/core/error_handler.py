@@ -106,7 +106,7 @@ class ErrorHandler:
             # Database connectors
             "chromadb": {
                 "feature": "ChromaDB vector database",
-                "install": "pip install chromadb langchain-community",
+                "install": "pip install chromadb",
                 "test": lambda: __import__("chromadb"),
             },
             "qdrant_client": {
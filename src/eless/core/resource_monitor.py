@@ -1,5 +1,6 @@
 import psutil
 import time
+import threading
 import logging
 from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
@@ -51,21 +52,83 @@ class ResourceMonitor:
         self.history_size = 10
         self.metrics_history = []
 
+        # Background sampler: hot paths (per-batch throttle checks) read the
+        # latest cached snapshot instead of paying a psutil round-trip --
+        # including a blocking 1s CPU average -- on every call.
+        self.sampling_interval = config.get("resource_limits", {}).get(
+            "sampling_interval_seconds", 0.1
+        )
+        self._latest_metrics: Optional[ResourceMetrics] = None
+        self._last_read_error: Optional[str] = None
+        self._stop_event = threading.Event()
+        self._sampler_thread = threading.Thread(
+            target=self._sample_loop, name="eless-resource-sampler", daemon=True
+        )
+        self._sampler_thread.start()
+
         logger.info(
             f"ResourceMonitor initialized - Memory thresholds: {self.memory_warning_threshold}%/{self.memory_critical_threshold}%, "
             f"CPU threshold: {self.cpu_high_threshold}%, Min memory: {self.min_available_memory_mb}MB"
         )
 
+    def _sample_loop(self):
+        """Background loop refreshing the cached metrics snapshot."""
+        while not self._stop_event.is_set():
+            try:
+                self._latest_metrics = self._read_metrics(cpu_interval=None)
+            except Exception as e:
+                logger.debug(f"Resource sampler error: {e}")
+            self._stop_event.wait(self.sampling_interval)
+
+    def close(self):
+        """Stop the background sampler thread.
+
+        Idempotent; after close() metric reads fall back to synchronous
+        measurements. Long-lived hosts that create monitors repeatedly
+        should close each one instead of relying on process exit.
+        """
+        self._stop_event.set()
+        if self._sampler_thread.is_alive():
+            self._sampler_thread.join(timeout=self.sampling_interval + 1)
+        self._latest_metrics = None
+
+    def __del__(self):
+        try:
+            self._stop_event.set()
+        except AttributeError:
+            pass  # Partially constructed instance
+
     def get_current_metrics(self) -> ResourceMetrics:
-        """Get current system resource metrics."""
+        """
+        Get current system resource metrics.
+
+        Returns the sampler's cached snapshot (at most ``sampling_interval``
+        old); falls back to a synchronous measurement before the sampler has
+        produced its first reading.
+        """
+        metrics = self._latest_metrics
+        if metrics is not None and not self._stop_event.is_set():
+            return metrics
+        # Before the first sample, or after close(): measure synchronously
+        return self.force_refresh()
+
+    def force_refresh(self) -> ResourceMetrics:
+        """Take a synchronous measurement, bypassing the cached snapshot."""
+        metrics = self._read_metrics(cpu_interval=1)
+        self._latest_metrics = metrics
+        return metrics
+
+    def _read_metrics(self, cpu_interval) -> ResourceMetrics:
+        """Read system resource metrics from psutil."""
         try:
             # Memory metrics
             memory = psutil.virtual_memory()
             memory_percent = memory.percent
             available_memory_mb = memory.available / (1024 * 1024)
 
-            # CPU metrics (1-second average)
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU metrics; interval=None returns the average since the last
+            # call, which is exactly what the periodic sampler wants
+            cpu_percent = psutil.cpu_percent(interval=cpu_interval)
 
             # Disk metrics for cache directory
             cache_dir = self.config["cache"]["directory"]
@@ -86,7 +149,13 @@ class ResourceMonitor:
             return metrics
 
         except Exception as e:
-            logger.error(f"Failed to get system metrics: {e}")
+            # Log repeated identical failures at debug so the periodic
+            # sampler does not flood the log with the same error
+            if str(e) != self._last_read_error:
+                self._last_read_error = str(e)
+                logger.error(f"Failed to get system metrics: {e}")
+            else:
+                logger.debug(f"Failed to get system metrics: {e}")
             # Return conservative estimates on error
             return ResourceMetrics(
                 cpu_percent=50.0,
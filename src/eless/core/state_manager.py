@@ -1,11 +1,38 @@
 import json
 import hashlib
+import os
+from collections import defaultdict
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import logging
 
 logger = logging.getLogger("ELESS.StateManager")
 
+# Optional fast JSON backend; the manifest is rewritten on every flush so
+# serialization speed matters for large corpora
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional incremental JSON parser; only worth the slower per-entry cost
+# when the manifest is big enough for peak parse memory to matter
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+    _MANIFEST_PARSE_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    _MANIFEST_PARSE_ERRORS = (ValueError,)
+
+# Manifests at or above this size are streamed entry-by-entry instead of
+# being materialized alongside their full byte buffer
+_STREAM_PARSE_MIN_SIZE = 8 * 1024 * 1024
+
 
 # Define the file processing states
 class FileStatus:
@@ -17,6 +44,29 @@ class FileStatus:
     ERROR = "ERROR"  # An error occurred during processing.
 
 
+# Membership sets built once instead of per update call
+_VALID_STATUSES = frozenset(
+    {
+        FileStatus.PENDING,
+        FileStatus.SCANNED,
+        FileStatus.CHUNKED,
+        FileStatus.EMBEDDED,
+        FileStatus.LOADED,
+        FileStatus.ERROR,
+    }
+)
+# Statuses that clear a file's error tracking on success
+_ERROR_RESET_STATUSES = frozenset({FileStatus.LOADED, FileStatus.EMBEDDED})
+# Canonical status objects: entries loaded from JSON are swapped onto these
+# so a 10k-entry manifest holds six shared strings, not 10k copies, and
+# status equality checks short-circuit on identity
+_CANONICAL_STATUS = {status: status for status in _VALID_STATUSES}
+# Statuses whose cache artifacts (chunks/vectors) are expected on disk
+_CACHED_DATA_STATUSES = frozenset(
+    {FileStatus.CHUNKED, FileStatus.EMBEDDED, FileStatus.LOADED}
+)
+
+
 class StateManager:
     """
     Manages the manifest.json file, tracking the state of all processed files
@@ -34,29 +84,65 @@ class StateManager:
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.manifest: Dict[str, Dict[str, Any]] = self._load_or_init_manifest()
+        self._rebuild_indexes()
+        # Set when deferred updates have not yet been persisted via flush()
+        self._dirty = False
         logger.info(
             f"StateManager initialized. Manifest loaded from {self.manifest_path}"
         )
 
     def _load_or_init_manifest(self) -> Dict[str, Dict[str, Any]]:
         """Loads the manifest file or creates an empty one if it doesn't exist."""
-        if self.manifest_path.exists():
-            try:
-                with open(self.manifest_path, "r") as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                logger.warning("Manifest file is corrupted. Initializing new manifest.")
-                return {}
-        return {}
+        try:
+            size = self.manifest_path.stat().st_size
+        except OSError:
+            return {}
+        try:
+            if IJSON_AVAILABLE and size >= _STREAM_PARSE_MIN_SIZE:
+                # Stream huge manifests entry-by-entry: peak memory is the
+                # parsed dict plus one entry, not the whole byte buffer
+                manifest = {}
+                with open(self.manifest_path, "rb") as f:
+                    for file_hash, entry in ijson.kvitems(f, ""):
+                        manifest[file_hash] = entry
+                return manifest
+            raw = self.manifest_path.read_bytes()
+            if ORJSON_AVAILABLE:
+                return orjson.loads(raw)
+            return json.loads(raw)
+        except _MANIFEST_PARSE_ERRORS:
+            logger.warning("Manifest file is corrupted. Initializing new manifest.")
+            return {}
+
+    def _rebuild_indexes(self):
+        """Derive the status and error-count indexes from the manifest.
+
+        Status queries (get_files_by_status, get_all_loaded_files,
+        get_error_files) read these instead of scanning every entry; the
+        update paths keep them in sync incrementally.
+        """
+        self._by_status: Dict[str, set] = defaultdict(set)
+        self._error_counts: Dict[str, int] = {}
+        for file_hash, file_info in self.manifest.items():
+            status = file_info["status"]
+            # Canonicalize in the same pass that builds the index
+            canonical = _CANONICAL_STATUS.get(status)
+            if canonical is not None and canonical is not status:
+                file_info["status"] = canonical
+                status = canonical
+            self._by_status[status].add(file_hash)
+            error_count = file_info.get("error_count", 0)
+            if error_count > 0:
+                self._error_counts[file_hash] = error_count
 
     def _save_manifest(self):
         """
         Writes the current state of the manifest back to disk atomically.
 
-        Uses atomic write pattern to prevent corruption:
-        1. Write to temporary file
-        2. Create backup of existing manifest
-        3. Atomically replace with new file
+        Serializes compactly (the manifest is machine-read state, not a
+        document for humans), writes to a temporary file and os.replace()s
+        it onto the final path — the manifest is never observable in a
+        partially written or missing state.
         """
 
         def path_converter(obj):
@@ -68,36 +154,46 @@ class StateManager:
 
         # Write to temporary file first
         tmp_path = self.manifest_path.with_suffix(".tmp")
-        backup_path = self.manifest_path.with_suffix(".bak")
 
         try:
-            # Write to temp file
-            with open(tmp_path, "w") as f:
-                json.dump(self.manifest, f, indent=4, default=path_converter)
-
-            # Backup existing manifest if it exists
-            if self.manifest_path.exists():
-                if backup_path.exists():
-                    backup_path.unlink()
-                self.manifest_path.rename(backup_path)
+            if ORJSON_AVAILABLE:
+                tmp_path.write_bytes(
+                    orjson.dumps(self.manifest, default=path_converter)
+                )
+            else:
+                with open(tmp_path, "w") as f:
+                    json.dump(
+                        self.manifest,
+                        f,
+                        separators=(",", ":"),
+                        default=path_converter,
+                    )
 
-            # Atomic rename (on same filesystem, this is atomic)
-            tmp_path.rename(self.manifest_path)
+            # Atomic swap (on same filesystem, this is atomic)
+            os.replace(tmp_path, self.manifest_path)
 
         except Exception as e:
             logger.error(f"Failed to save manifest: {e}")
             # Clean up temp file if it exists
             if tmp_path.exists():
                 tmp_path.unlink()
-            # Restore from backup if main file is gone
-            if not self.manifest_path.exists() and backup_path.exists():
-                backup_path.rename(self.manifest_path)
-                logger.info("Restored manifest from backup")
             raise
 
     def get_status(self, file_hash: str) -> str:
         """Returns the current status of a file using its hash."""
-        return self.manifest.get(file_hash, {}).get("status", FileStatus.PENDING)
+        entry = self.manifest.get(file_hash)
+        return entry["status"] if entry is not None else FileStatus.PENDING
+
+    def get_status_bulk(self, file_hashes: List[str]) -> Dict[str, str]:
+        """Returns the statuses of many files in a single manifest pass."""
+        get = self.manifest.get
+        statuses = {}
+        for file_hash in file_hashes:
+            entry = get(file_hash)
+            statuses[file_hash] = (
+                entry["status"] if entry is not None else FileStatus.PENDING
+            )
+        return statuses
 
     def is_file_known(self, file_hash: str) -> bool:
         """Checks if a file (hash) is tracked in the manifest."""
@@ -125,77 +221,142 @@ class StateManager:
             TypeError: If status is not a valid string type
         """
         try:
-            if not isinstance(status, str):
-                raise TypeError(f"Status must be a string, got {type(status).__name__}")
-            
-            valid_statuses = [
-                FileStatus.PENDING, FileStatus.SCANNED, FileStatus.CHUNKED,
-                FileStatus.EMBEDDED, FileStatus.LOADED, FileStatus.ERROR
-            ]
-            if status not in valid_statuses:
-                raise ValueError(f"Invalid status '{status}'. Must be one of {valid_statuses}")
-            if file_hash not in self.manifest:
-                # New file - path is required
-                if file_path is None:
-                    raise ValueError(
-                        f"file_path is required when adding new file {file_hash[:8]}"
-                    )
-                self.manifest[file_hash] = {
-                    "path": file_path,
-                    "timestamp": self._get_current_timestamp(),
-                    "status": FileStatus.PENDING,
-                    "metadata": {},
-                    "hash": file_hash,  # Store hash consistently
-                    "error_count": 0,
-                    "last_error": None,
-                }
-
-            # Update status and timestamp
-            old_status = self.manifest[file_hash]["status"]
-            self.manifest[file_hash]["status"] = status
-            self.manifest[file_hash]["timestamp"] = self._get_current_timestamp()
-
-            # Only update path if explicitly provided
-            if file_path is not None:
-                self.manifest[file_hash]["path"] = file_path
-
-            # Handle error status specially
-            if status == FileStatus.ERROR:
-                self.manifest[file_hash]["error_count"] += 1
-                if metadata and "error" in metadata:
-                    self.manifest[file_hash]["last_error"] = metadata["error"]
-                else:
-                    self.manifest[file_hash][
-                        "last_error"
-                    ] = self._get_current_timestamp()
-            elif status in [FileStatus.LOADED, FileStatus.EMBEDDED]:
-                # Reset error count on successful status
-                self.manifest[file_hash]["error_count"] = 0
-                self.manifest[file_hash]["last_error"] = None
-
-            if metadata:
-                self.manifest[file_hash]["metadata"].update(metadata)
-
+            self._apply_update(file_hash, status, file_path, metadata)
             # Save manifest immediately after a state change for robust checkpointing
             self._save_manifest()
+        except Exception as e:
+            logger.error(
+                f"Failed to update file {file_hash[:8]} status to {status}: {e}"
+            )
+            raise
 
-            if old_status != status:
-                logger.debug(
-                    f"File {file_hash[:8]} status changed: {old_status} → {status}"
-                )
+    def add_or_update_file_deferred(
+        self,
+        file_hash: str,
+        status: str,
+        file_path: Optional[str] = None,
+        metadata: Optional[Dict] = None,
+    ):
+        """
+        In-memory variant of add_or_update_file for batched checkpointing.
 
+        Applies the same transition logic but leaves the manifest dirty in
+        memory; callers batch many transitions and persist them with a single
+        flush() instead of paying one atomic manifest rewrite per change.
+        """
+        try:
+            self._apply_update(file_hash, status, file_path, metadata)
+            self._dirty = True
         except Exception as e:
             logger.error(
                 f"Failed to update file {file_hash[:8]} status to {status}: {e}"
             )
             raise
 
+    def bulk_update_status(self, file_hashes: List[str], status: str):
+        """Moves many known files to one status with a single manifest write.
+
+        Equivalent to add_or_update_file per hash, but the atomic manifest
+        rewrite is paid once for the whole group instead of once per file.
+        """
+        if not file_hashes:
+            return
+        try:
+            for file_hash in file_hashes:
+                self._apply_update(file_hash, status)
+            self._save_manifest()
+        except Exception as e:
+            logger.error(
+                f"Failed bulk status update of {len(file_hashes)} files to {status}: {e}"
+            )
+            raise
+
+    def flush(self):
+        """Persist any deferred state changes to the manifest on disk."""
+        if self._dirty:
+            self._save_manifest()
+            self._dirty = False
+
+    def __del__(self):
+        # Last-resort safety net for deferred updates; callers are expected
+        # to flush() at stage boundaries (interpreter teardown may have
+        # already torn down the machinery this needs, hence best-effort)
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+    def _apply_update(
+        self,
+        file_hash: str,
+        status: str,
+        file_path: Optional[str] = None,
+        metadata: Optional[Dict] = None,
+    ):
+        """Validates and applies a state transition to the in-memory manifest."""
+        if not isinstance(status, str):
+            raise TypeError(f"Status must be a string, got {type(status).__name__}")
+
+        if status not in _VALID_STATUSES:
+            raise ValueError(
+                f"Invalid status '{status}'. Must be one of {sorted(_VALID_STATUSES)}"
+            )
+        # One timestamp per update; every field written below shares it
+        ts = self._get_current_timestamp()
+        if file_hash not in self.manifest:
+            # New file - path is required
+            if file_path is None:
+                raise ValueError(
+                    f"file_path is required when adding new file {file_hash[:8]}"
+                )
+            self.manifest[file_hash] = {
+                "path": file_path,
+                "timestamp": ts,
+                "status": FileStatus.PENDING,
+                "metadata": {},
+                "hash": file_hash,  # Store hash consistently
+                "error_count": 0,
+                "last_error": None,
+            }
+
+        # Update status and timestamp
+        old_status = self.manifest[file_hash]["status"]
+        self.manifest[file_hash]["status"] = status
+        self.manifest[file_hash]["timestamp"] = ts
+        self._by_status[old_status].discard(file_hash)
+        self._by_status[status].add(file_hash)
+
+        # Only update path if explicitly provided
+        if file_path is not None:
+            self.manifest[file_hash]["path"] = file_path
+
+        # Handle error status specially
+        if status == FileStatus.ERROR:
+            self.manifest[file_hash]["error_count"] += 1
+            self._error_counts[file_hash] = self.manifest[file_hash]["error_count"]
+            if metadata and "error" in metadata:
+                self.manifest[file_hash]["last_error"] = metadata["error"]
+            else:
+                self.manifest[file_hash]["last_error"] = ts
+        elif status in _ERROR_RESET_STATUSES:
+            # Reset error count on successful status
+            self.manifest[file_hash]["error_count"] = 0
+            self.manifest[file_hash]["last_error"] = None
+            self._error_counts.pop(file_hash, None)
+
+        if metadata:
+            self.manifest[file_hash]["metadata"].update(metadata)
+
+        if old_status != status:
+            logger.debug(
+                f"File {file_hash[:8]} status changed: {old_status} → {status}"
+            )
+
     def get_all_loaded_files(self) -> List[str]:
         """Returns a list of file paths that are fully LOADED."""
         return [
-            item["path"]
-            for item in self.manifest.values()
-            if item["status"] == FileStatus.LOADED
+            self.manifest[file_hash]["path"]
+            for file_hash in self._by_status.get(FileStatus.LOADED, ())
         ]
 
     def get_all_hashes(self) -> List[str]:
@@ -204,9 +365,7 @@ class StateManager:
 
     def _get_current_timestamp(self) -> str:
         """Utility function to get a simple timestamp for tracking."""
-        import datetime
-
-        return datetime.datetime.now().isoformat()
+        return datetime.now().isoformat()
 
     def cleanup_orphaned_states(self, archiver) -> int:
         """
@@ -218,27 +377,26 @@ class StateManager:
         Returns:
             Number of orphaned entries removed
         """
+        # One directory listing answers existence for every hash, instead of
+        # loading (and deserializing) each entry's chunks and vectors
+        cached_hashes = archiver.list_cached_hashes()
         orphaned_hashes = []
 
         for file_hash, file_info in self.manifest.items():
-            # Check if cache files exist for this hash
-            has_chunks = archiver.load_chunks(file_hash) is not None
-            has_vectors = archiver.load_vectors(file_hash) is not None
-
             # If no cache data and status indicates it should exist, mark as orphaned
-            if file_info["status"] in [
-                FileStatus.CHUNKED,
-                FileStatus.EMBEDDED,
-                FileStatus.LOADED,
-            ]:
-                if not has_chunks and not has_vectors:
-                    orphaned_hashes.append(file_hash)
-                    logger.warning(
-                        f"Orphaned manifest entry found: {file_hash[:8]} - no cache data exists"
-                    )
+            if (
+                file_info["status"] in _CACHED_DATA_STATUSES
+                and file_hash not in cached_hashes
+            ):
+                orphaned_hashes.append(file_hash)
+                logger.warning(
+                    f"Orphaned manifest entry found: {file_hash[:8]} - no cache data exists"
+                )
 
         # Remove orphaned entries
         for file_hash in orphaned_hashes:
+            self._by_status[self.manifest[file_hash]["status"]].discard(file_hash)
+            self._error_counts.pop(file_hash, None)
             del self.manifest[file_hash]
 
         if orphaned_hashes:
@@ -257,12 +415,11 @@ class StateManager:
         Returns:
             List of file hashes with high error counts
         """
-        error_files = []
-        for file_hash, file_info in self.manifest.items():
-            if file_info.get("error_count", 0) >= min_error_count:
-                error_files.append(file_hash)
-
-        return error_files
+        return [
+            file_hash
+            for file_hash, error_count in self._error_counts.items()
+            if error_count >= min_error_count
+        ]
 
     def reset_file_status(self, file_hash: str) -> bool:
         """
@@ -276,6 +433,9 @@ class StateManager:
             True if file was reset, False if file not found
         """
         if file_hash in self.manifest:
+            self._by_status[self.manifest[file_hash]["status"]].discard(file_hash)
+            self._by_status[FileStatus.PENDING].add(file_hash)
+            self._error_counts.pop(file_hash, None)
             self.manifest[file_hash]["status"] = FileStatus.PENDING
             self.manifest[file_hash]["error_count"] = 0
             self.manifest[file_hash]["last_error"] = None
@@ -307,11 +467,7 @@ class StateManager:
         Returns:
             List of file hashes with the specified status
         """
-        return [
-            file_hash
-            for file_hash, file_info in self.manifest.items()
-            if file_info["status"] == status
-        ]
+        return list(self._by_status.get(status, ()))
 
     def get_manifest_stats(self) -> Dict[str, Any]:
         """
@@ -320,25 +476,23 @@ class StateManager:
         Returns:
             Dictionary with manifest statistics
         """
-        status_counts = {}
-        total_errors = 0
-        files_with_errors = 0
-
-        for file_info in self.manifest.values():
-            status = file_info["status"]
-            status_counts[status] = status_counts.get(status, 0) + 1
-
-            error_count = file_info.get("error_count", 0)
-            total_errors += error_count
-            if error_count > 0:
-                files_with_errors += 1
+        # Counts come straight off the maintained indexes; the on-disk size
+        # is one stat instead of materializing the manifest's repr
+        try:
+            manifest_size_kb = self.manifest_path.stat().st_size / 1024
+        except OSError:
+            manifest_size_kb = 0
 
         return {
             "total_files": len(self.manifest),
-            "status_counts": status_counts,
-            "total_errors": total_errors,
-            "files_with_errors": files_with_errors,
-            "manifest_size_kb": len(str(self.manifest)) / 1024,
+            "status_counts": {
+                status: len(hashes)
+                for status, hashes in self._by_status.items()
+                if hashes
+            },
+            "total_errors": sum(self._error_counts.values()),
+            "files_with_errors": len(self._error_counts),
+            "manifest_size_kb": manifest_size_kb,
         }
 
     def get_file_hash(self, file_path: str) -> str:
@@ -385,5 +539,6 @@ class StateManager:
         Clear all state by resetting the manifest to empty.
         """
         self.manifest = {}
+        self._rebuild_indexes()
         self._save_manifest()
         logger.info("State cleared")
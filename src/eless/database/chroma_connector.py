@@ -32,6 +32,9 @@ class ChromaDBConnector(DBConnectorBase):
     Supports both persistent (disk) and in-memory modes.
     """
 
+    # collection.upsert accepts ndarray rows as embeddings directly
+    accepts_ndarray = True
+
     def __init__(self, config: Dict[str, Any], connection_name: str, dimension: int):
         super().__init__(config, connection_name, dimension)
 
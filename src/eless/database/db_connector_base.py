@@ -12,6 +12,16 @@ class DBConnectorBase(ABC):
     must inherit from this class and implement its abstract methods.
     """
 
+    # Set True on connectors whose upsert_batch handles numpy ndarray rows in
+    # 'vector' directly; callers then skip the per-record list conversion.
+    accepts_ndarray = False
+
+    # Set True on connectors implementing upsert_batch_async; the loader
+    # then drives their upserts through its shared event loop, keeping many
+    # statements in flight per connection instead of one blocking call per
+    # pool thread.
+    supports_async = False
+
     def __init__(self, config: Dict[str, Any], connection_name: str, dimension: int):
         """
         Initializes the connector with configuration, the connection name
@@ -44,6 +54,16 @@ class DBConnectorBase(ABC):
         """
         pass
 
+    async def upsert_batch_async(self, vectors: List[Dict[str, Any]]):
+        """
+        Async variant of upsert_batch for connectors that set
+        supports_async. Same batch contract; runs on the loader's event
+        loop.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not implement an async upsert path"
+        )
+
     @abstractmethod
     def search(
         self, query_vector: List[float], limit: int = 10
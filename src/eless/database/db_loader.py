@@ -1,8 +1,16 @@
+import asyncio
+import importlib
 import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Dict, Any, List, Generator, Optional
 
+import numpy as np
+
 # Import the base connector and components from other layers
 from .db_connector_base import DBConnectorBase
+from .query_cache import QueryCache
 from ..core.state_manager import StateManager, FileStatus
 from ..core.logging_config import log_performance
 
@@ -12,53 +20,42 @@ from ..embedding.model_loader import ModelLoader
 # Initialize logger early
 logger = logging.getLogger("ELESS.DBLoader")
 
-# Import all concrete connector classes with fallback
-try:
-    from .chroma_connector import ChromaDBConnector
-
-    CHROMA_AVAILABLE = True
-except ImportError:
-    logger.warning(
-        "ChromaDB connector not available - install chromadb and langchain-community"
-    )
-    ChromaDBConnector = None
-    CHROMA_AVAILABLE = False
-
-try:
-    from .qdrant_connector import QdrantConnector
-
-    QDRANT_AVAILABLE = True
-except ImportError:
-    logger.warning("Qdrant connector not available - install qdrant-client")
-    QdrantConnector = None
-    QDRANT_AVAILABLE = False
-
-try:
-    from .faiss_connector import FaissConnector
-
-    FAISS_AVAILABLE = True
-except ImportError:
-    logger.warning("FAISS connector not available - install faiss-cpu or faiss-gpu")
-    FaissConnector = None
-    FAISS_AVAILABLE = False
-
-try:
-    from .postgresql_connector import PostgreSQLConnector
-
-    POSTGRESQL_AVAILABLE = True
-except ImportError:
-    logger.warning("PostgreSQL connector not available - install psycopg2-binary")
-    PostgreSQLConnector = None
-    POSTGRESQL_AVAILABLE = False
-
-try:
-    from .cassandra_connector import CassandraConnector
-
-    CASSANDRA_AVAILABLE = True
-except ImportError:
-    logger.warning("Cassandra connector not available - install cassandra-driver")
-    CassandraConnector = None
-    CASSANDRA_AVAILABLE = False
+# Maps the 'type' field in the config to (module, class, install hint).
+# Connector modules are imported lazily, only for configured targets: each
+# one drags in a heavy client stack (chromadb, psycopg2, the faiss native
+# library, cassandra-driver) whose import alone costs hundreds of
+# milliseconds and real RSS, which a run targeting one database should
+# never pay for the other four.
+_CONNECTOR_REGISTRY = {
+    "chroma": (".chroma_connector", "ChromaDBConnector", "install chromadb"),
+    "qdrant": (".qdrant_connector", "QdrantConnector", "install qdrant-client"),
+    "faiss": (".faiss_connector", "FaissConnector", "install faiss-cpu or faiss-gpu"),
+    "postgresql": (
+        ".postgresql_connector",
+        "PostgreSQLConnector",
+        "install psycopg2-binary",
+    ),
+    "cassandra": (
+        ".cassandra_connector",
+        "CassandraConnector",
+        "install cassandra-driver",
+    ),
+}
+
+
+def _load_connector_class(db_type: str):
+    """Imports and returns the connector class for db_type, or None.
+
+    Missing optional dependencies surface here as a warning, matching the
+    old import-time fallback behavior.
+    """
+    module_name, class_name, install_hint = _CONNECTOR_REGISTRY[db_type]
+    try:
+        module = importlib.import_module(module_name, package=__package__)
+    except ImportError:
+        logger.warning(f"{db_type} connector not available - {install_hint}")
+        return None
+    return getattr(module, class_name)
 
 
 class DatabaseLoader:
@@ -67,6 +64,10 @@ class DatabaseLoader:
     of vectors and chunks into them.
     """
 
+    # Two queued batches keep the upsert thread fed while the next batch
+    # accumulates, without letting a slow target buffer the whole run
+    _BATCH_QUEUE_DEPTH = 2
+
     def __init__(
         self, config: Dict[str, Any], state_manager: StateManager, embedding_model
     ):
@@ -74,6 +75,17 @@ class DatabaseLoader:
         self.state_manager = state_manager
         self.embedding_model = embedding_model
         self.batch_size = config["databases"]["batch_size"]
+        # Width vectors are stored/shipped at; narrower dtypes halve or
+        # quarter per-vector payload for targets that accept them
+        self.storage_dtype = config["embedding"].get("storage_dtype", "float32")
+
+        # Repeated queries are served from memory instead of re-querying
+        # every target; invalidated whenever a batch is upserted
+        cache_config = config["databases"].get("query_cache") or {}
+        self.query_cache = QueryCache(
+            max_size=cache_config.get("max_size", 256),
+            ttl_seconds=cache_config.get("ttl_seconds", 300),
+        )
 
         # Get the embedding dimension from the config or model
         if embedding_model and hasattr(
@@ -94,6 +106,30 @@ class DatabaseLoader:
 
         # Call the updated initialization method
         self._initialize_connectors()
+
+        # One long-lived pool for the per-batch fan-out, sized so every
+        # target's upsert can be in flight at once; the DB client libraries
+        # release the GIL during network/disk I/O
+        self._upsert_executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self.active_connectors)),
+            thread_name_prefix="eless-upsert",
+        )
+
+        # Shared event loop on a daemon thread for connectors with a native
+        # async upsert path; run_coroutine_threadsafe hands back
+        # concurrent.futures futures, so async and pool-thread upserts are
+        # awaited by the same wait() in _upsert_batch
+        self._async_loop = None
+        if any(
+            getattr(connector, "supports_async", False)
+            for connector in self.active_connectors.values()
+        ):
+            self._async_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=self._async_loop.run_forever,
+                name="eless-async-upsert",
+                daemon=True,
+            ).start()
         logger.info(
             f"DatabaseLoader initialized. Active targets: {list(self.active_connectors.keys())}"
         )
@@ -110,31 +146,7 @@ class DatabaseLoader:
         """
         logger.info("Initializing database connectors...")
 
-        # --- CONNECTOR MAPPING ---
-        # Maps the 'type' field in the config to the concrete Python class
-        CONNECTOR_MAP = {}
-
-        # Add connectors conditionally based on availability
-        if CHROMA_AVAILABLE:
-            CONNECTOR_MAP["chroma"] = ChromaDBConnector
-        if QDRANT_AVAILABLE:
-            CONNECTOR_MAP["qdrant"] = QdrantConnector
-        if FAISS_AVAILABLE:
-            CONNECTOR_MAP["faiss"] = FaissConnector
-        if POSTGRESQL_AVAILABLE:
-            CONNECTOR_MAP["postgresql"] = PostgreSQLConnector
-        if CASSANDRA_AVAILABLE:
-            CONNECTOR_MAP["cassandra"] = CassandraConnector
-        # -------------------------
-
         target_names = self.config["databases"]["targets"]
-        # Filter to only available types
-        available_targets = [name for name in target_names if name in CONNECTOR_MAP]
-        if set(target_names) != set(available_targets):
-            logger.warning(
-                f"Some targets not available: {set(target_names) - set(available_targets)}. Using: {available_targets}"
-            )
-        target_names = available_targets
         logger.info(f"Target databases from config: {target_names}")
 
         for name in target_names:
@@ -155,9 +167,12 @@ class DatabaseLoader:
                 )
                 continue
 
-            if db_type in CONNECTOR_MAP:
+            if db_type in _CONNECTOR_REGISTRY:
+                connector_class = _load_connector_class(db_type)
+                if connector_class is None:
+                    # Optional dependency missing; warning already logged
+                    continue
                 try:
-                    connector_class = CONNECTOR_MAP[db_type]
                     logger.debug(f"Creating {db_type} connector for '{name}'")
 
                     # 1. Instantiate the connector
@@ -185,7 +200,7 @@ class DatabaseLoader:
                     )
             else:
                 logger.error(
-                    f"Unknown database type '{db_type}' configured for connection '{name}'. Available types: {list(CONNECTOR_MAP.keys())}"
+                    f"Unknown database type '{db_type}' configured for connection '{name}'. Available types: {list(_CONNECTOR_REGISTRY.keys())}"
                 )
 
         logger.info(
@@ -205,36 +220,80 @@ class DatabaseLoader:
             )
             return
 
-        batch: List[Dict[str, Any]] = []
+        # Fixed-size accumulation buffer plus a write index: entries are
+        # slotted in place instead of growing (and reallocating) a list per
+        # batch. The flush slice is a fresh list, which the consumer thread
+        # then owns outright while the buffer is refilled.
+        buffer: List[Optional[Dict[str, Any]]] = [None] * self.batch_size
+        buffered = 0
         # Use a set to track file hashes that were processed in this run
         file_hashes_in_run: Dict[str, bool] = (
             {}
         )  # {file_hash: True if all DBs upserted}
 
-        for chunk_data in embedded_chunk_generator:
-
-            # 1. Prepare data for upsert
-            file_hash = chunk_data["metadata"]["file_hash"]
-            chunk_id = chunk_data["metadata"]["chunk_id"]
-
-            # Structure required by the DB connectors
-            db_entry = {
-                # Ensure vector is a List or tuple for JSON serialization/DB API, not NumPy array
-                "id": chunk_id,
-                "vector": chunk_data["vector"].tolist(),
-                "metadata": chunk_data["metadata"],  # Includes hash, index, etc.
-            }
-            batch.append(db_entry)
-            file_hashes_in_run[file_hash] = file_hashes_in_run.get(file_hash, True)
-
-            # 2. Process batch if full
-            if len(batch) >= self.batch_size:
-                self._upsert_batch(batch, file_hashes_in_run)
-                batch = []
+        # Full batches are handed to a consumer thread through a bounded
+        # queue, so chunk production (CPU) overlaps the database upserts
+        # (I/O) instead of alternating with them; the bound caps how many
+        # batches can pile up behind a slow target
+        batch_queue: queue.Queue = queue.Queue(maxsize=self._BATCH_QUEUE_DEPTH)
+        upsert_errors: List[BaseException] = []
+
+        def _drain():
+            while True:
+                queued = batch_queue.get()
+                if queued is None:
+                    return
+                try:
+                    self._upsert_batch(queued, file_hashes_in_run)
+                except Exception as e:  # Keep draining so put() never deadlocks
+                    upsert_errors.append(e)
 
-        # 3. Process the final, partial batch
-        if batch:
-            self._upsert_batch(batch, file_hashes_in_run)
+        upsert_thread = threading.Thread(
+            target=_drain, name="eless-batch-upsert", daemon=True
+        )
+        upsert_thread.start()
+
+        # Hot-loop bindings: resolved once instead of per chunk
+        queue_put = batch_queue.put
+        run_get = file_hashes_in_run.get
+
+        try:
+            for chunk_data in embedded_chunk_generator:
+
+                # 1. Prepare data for upsert; one metadata lookup serves the
+                # hash, the chunk id and the entry itself
+                metadata = chunk_data["metadata"]
+                file_hash = metadata["file_hash"]
+
+                # Structure required by the DB connectors
+                db_entry = {
+                    "id": metadata["chunk_id"],
+                    # Kept as the ndarray row: a per-chunk tolist() here would
+                    # allocate ~dim Python floats per vector. Connectors that
+                    # cannot consume ndarrays get one whole-batch conversion
+                    # in _upsert_batch instead.
+                    "vector": chunk_data["vector"],
+                    "metadata": metadata,  # Includes hash, index, etc.
+                }
+                buffer[buffered] = db_entry
+                buffered += 1
+                file_hashes_in_run[file_hash] = run_get(file_hash, True)
+
+                # 2. Queue the batch if the buffer is full
+                if buffered >= self.batch_size:
+                    queue_put(buffer[:buffered])
+                    buffered = 0
+
+            # 3. Queue the final, partial batch
+            if buffered:
+                queue_put(buffer[:buffered])
+        finally:
+            # Sentinel stops the consumer; join before reading its results
+            batch_queue.put(None)
+            upsert_thread.join()
+
+        if upsert_errors:
+            raise upsert_errors[0]
 
         # 4. Final state update
         self._update_file_status(file_hashes_in_run)
@@ -248,43 +307,113 @@ class DatabaseLoader:
             f"Upserting batch of size {len(batch)} to {len(self.active_connectors)} targets."
         )
 
-        # Fan-out to all target databases
+        if self.storage_dtype != "float32":
+            self._quantize_batch(batch)
+
+        # Built once and shared by every connector that needs Python-list
+        # vectors
+        list_batch = None
+        if any(
+            not getattr(connector, "accepts_ndarray", False)
+            for connector in self.active_connectors.values()
+        ):
+            list_batch = self._listify_batch(batch)
+
+        # Fan the batch out to all targets in parallel: each connector gets
+        # its own pool thread, so total batch latency tracks the slowest
+        # target instead of the sum of all of them
+        futures = {}
         for name, connector in self.active_connectors.items():
-            try:
-                connector.upsert_batch(batch)
+            payload = (
+                batch if getattr(connector, "accepts_ndarray", False) else list_batch
+            )
+            if self._async_loop is not None and getattr(
+                connector, "supports_async", False
+            ):
+                future = asyncio.run_coroutine_threadsafe(
+                    connector.upsert_batch_async(payload), self._async_loop
+                )
+            else:
+                future = self._upsert_executor.submit(connector.upsert_batch, payload)
+            futures[future] = name
+        wait(futures)
+
+        for future, name in futures.items():
+            error = future.exception()
+            if error is None:
                 logger.debug(f"Successfully upserted batch to {name}.")
-            except Exception as e:
-                logger.error(f"Failed to upsert batch to {name}. Error: {e}")
+            else:
+                logger.error(f"Failed to upsert batch to {name}. Error: {error}")
                 # CRITICAL: Mark all files in this failed batch as NOT fully loaded
                 for entry in batch:
                     file_hash = entry["metadata"]["file_hash"]
                     file_hashes_in_run[file_hash] = False
 
+        # Cached search results predate this batch
+        self.query_cache.invalidate()
+
+    def _quantize_batch(self, batch: List[Dict[str, Any]]):
+        """Narrows batch vectors to the configured storage dtype, in place.
+
+        One vectorized conversion over the stacked batch. int8 uses a
+        symmetric per-vector quantizer; its scale is recorded in the
+        entry's metadata so consumers can dequantize.
+        """
+        array = np.asarray([entry["vector"] for entry in batch], dtype="float32")
+        if self.storage_dtype == "float16":
+            quantized = array.astype("float16")
+            for entry, row in zip(batch, quantized):
+                entry["vector"] = row
+        else:  # int8
+            scale = np.abs(array).max(axis=1, keepdims=True) / 127.0
+            np.maximum(scale, 1e-12, out=scale)  # all-zero vectors
+            quantized = np.round(array / scale).astype("int8")
+            for entry, row, row_scale in zip(batch, quantized, scale):
+                entry["vector"] = row
+                entry["metadata"]["vector_scale"] = float(row_scale[0])
+
+    @staticmethod
+    def _listify_batch(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Returns the batch with vectors as Python lists.
+
+        Stacks all vectors into one 2D array and converts it with a single
+        tolist() call in C, instead of reboxing each vector's values
+        individually. The storage dtype is preserved (int8 rows become
+        Python ints, halving the serialized payload); only double-width
+        input is narrowed to float32.
+        """
+        array = np.asarray([entry["vector"] for entry in batch])
+        if array.dtype == np.float64:
+            array = array.astype("float32")
+        rows = array.tolist()
+        return [
+            {"id": entry["id"], "vector": row, "metadata": entry["metadata"]}
+            for entry, row in zip(batch, rows)
+        ]
+
     def _update_file_status(self, file_hashes_in_run: Dict[str, bool]):
         """Updates the status of files that were successfully loaded to *all* targets."""
-        for file_hash, success in file_hashes_in_run.items():
-            if success:
-                # Only update status if ALL upsert batches that touched this file were successful.
-                # Files with FileStatus.LOADED are already skipped by the Dispatcher,
-                # so this marks files that were *just* processed and successfully loaded.
-                current_path = self.state_manager.manifest[file_hash]["path"]
-                self.state_manager.add_or_update_file(
-                    file_hash, status=FileStatus.LOADED, file_path=current_path
-                )
-                logger.info(f"File {file_hash[:8]} status set to LOADED.")
-            else:
-                # If loading failed for any reason (DB connection lost, upsert error),
-                # we revert the status to EMBEDDED so it can be re-tried on the next run.
-                # This assumes the file's chunks and vectors are still in cache.
-                current_path = self.state_manager.manifest[file_hash]["path"]
-                self.state_manager.add_or_update_file(
-                    file_hash,
-                    status=FileStatus.EMBEDDED,
-                    file_path=current_path,
-                )
-                logger.warning(
-                    f"File {file_hash[:8]} failed to load to one or more databases. Status reverted to EMBEDDED."
-                )
+        loaded = [h for h, success in file_hashes_in_run.items() if success]
+        failed = [h for h, success in file_hashes_in_run.items() if not success]
+
+        # Only mark LOADED if ALL upsert batches that touched a file were
+        # successful. Files with FileStatus.LOADED are already skipped by
+        # the Dispatcher, so this marks files that were *just* processed
+        # and successfully loaded. Each group is one bulk transition (and
+        # one manifest write) instead of a per-file round-trip.
+        if loaded:
+            self.state_manager.bulk_update_status(loaded, FileStatus.LOADED)
+            logger.info(f"{len(loaded)} file(s) set to LOADED.")
+
+        # If loading failed for any reason (DB connection lost, upsert
+        # error), revert to EMBEDDED so the files are re-tried on the next
+        # run. This assumes their chunks and vectors are still in cache.
+        if failed:
+            self.state_manager.bulk_update_status(failed, FileStatus.EMBEDDED)
+            logger.warning(
+                f"{len(failed)} file(s) failed to load to one or more databases. "
+                "Status reverted to EMBEDDED."
+            )
 
     def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -300,6 +429,11 @@ class DatabaseLoader:
         # Embed the query
         query_vector = self.embedding_model.embed_chunks([query])[0]
 
+        cache_key = QueryCache.make_key(query_vector, limit)
+        cached = self.query_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         all_results = []
         for name, connector in self.active_connectors.items():
             try:
@@ -310,7 +444,9 @@ class DatabaseLoader:
 
         # Sort by score if available and limit
         all_results.sort(key=lambda x: x.get("score", 0), reverse=True)
-        return all_results[:limit]
+        all_results = all_results[:limit]
+        self.query_cache.put(cache_key, all_results)
+        return all_results
 
     def batch_upsert(self, batch: List[Dict[str, Any]]):
         """
@@ -325,9 +461,25 @@ class DatabaseLoader:
                 logger.debug(f"Batch upserted to {name}")
             except Exception as e:
                 logger.error(f"Batch upsert failed on {name}: {e}")
+        self.query_cache.invalidate()
 
     def close(self):
         """Closes all active database connections."""
+        # Drain in-flight upserts before tearing down the connectors they use
+        self._upsert_executor.shutdown(wait=True)
+        if self._async_loop is not None:
+            # Async resources must be released on the loop that owns them
+            for name, connector in self.active_connectors.items():
+                closer = getattr(connector, "close_async", None)
+                if closer is None:
+                    continue
+                try:
+                    asyncio.run_coroutine_threadsafe(
+                        closer(), self._async_loop
+                    ).result(timeout=30)
+                except Exception as e:
+                    logger.warning(f"Error closing async resources for {name}: {e}")
+            self._async_loop.call_soon_threadsafe(self._async_loop.stop)
         for name, connector in self.active_connectors.items():
             try:
                 connector.close()
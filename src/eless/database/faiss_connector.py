@@ -1,4 +1,6 @@
+import hashlib
 import logging
+import pickle
 from typing import Dict, Any, List
 from pathlib import Path
 import numpy as np
@@ -9,9 +11,23 @@ from .db_connector_base import DBConnectorBase
 logger = logging.getLogger("ELESS.FaissConnector")
 
 
+def _int64_id(str_id: str) -> int:
+    """Stable 64-bit id for a string chunk id.
+
+    Derived from the id itself (not a counter), so re-upserting the same
+    chunk maps to the same Faiss id across batches and process restarts.
+    """
+    digest = hashlib.blake2b(str_id.encode(), digest_size=8).digest()
+    return int(np.frombuffer(digest, dtype=np.int64)[0])
+
+
 class FaissConnector(DBConnectorBase):
     """Concrete connector for the local/in-memory Faiss index."""
 
+    # upsert_batch funnels vectors through np.array, which consumes ndarray
+    # rows without an intermediate Python-list round-trip
+    accepts_ndarray = True
+
     def __init__(self, config: Dict[str, Any], connection_name: str, dimension: int):
         super().__init__(config, connection_name, dimension)
         self.index: faiss.Index = None
@@ -20,12 +36,15 @@ class FaissConnector(DBConnectorBase):
             {}
         )  # To store metadata since Faiss only stores vectors
         self.id_map: Dict[int, str] = {}  # int_id -> original_id
-        self.id_counter = 0
+        self.index_type = self.db_config.get("index_type", "hnsw")
         self.save_path = Path(
             self.db_config.get("save_path", "./eless_cache/faiss_data")
         )
         self.save_path.mkdir(parents=True, exist_ok=True)
         self.save_file = self.save_path / self.index_file
+        # Sidecar holding data_store/id_map; Faiss itself only persists
+        # vectors
+        self.meta_file = self.save_file.with_suffix(".meta.pkl")
 
     def connect(self):
         try:
@@ -33,39 +52,99 @@ class FaissConnector(DBConnectorBase):
                 # Load existing index
                 self.index = faiss.read_index(str(self.save_file))
                 logger.info(f"Faiss index loaded from {self.save_file}")
-                # Load metadata store (optional, for full recovery)
-                # NOTE: Metadata loading is omitted for brevity but required for full functionality
+                self._load_metadata()
             else:
-                # Create a new index with ID mapping
-                self.index = faiss.IndexIDMap(faiss.IndexFlatL2(self.dimension))
-                logger.info("Faiss index created (IndexIDMap with IndexFlatL2).")
+                # Create a new index with ID mapping; IndexIDMap2 keeps the
+                # id->vector association reconstructible
+                self.index = faiss.IndexIDMap2(self._build_base_index())
+                logger.info(
+                    f"Faiss index created (IndexIDMap2 over '{self.index_type}')."
+                )
 
         except Exception as e:
             logger.error(f"Failed to connect or set up Faiss: {e}")
             raise
 
+    def _load_metadata(self):
+        """Restores the id and metadata stores saved alongside the index.
+
+        Without them a reloaded index resolves searches to int ids that
+        map to nothing, so every hit comes back empty.
+        """
+        if not self.meta_file.exists():
+            logger.warning(
+                f"No metadata sidecar at {self.meta_file}; search results "
+                "from the reloaded index will lack metadata."
+            )
+            return
+        try:
+            with open(self.meta_file, "rb") as f:
+                stored = pickle.load(f)
+            self.data_store = stored["data_store"]
+            self.id_map = stored["id_map"]
+            logger.info(
+                f"Faiss metadata restored for {len(self.data_store)} entries."
+            )
+        except Exception as e:
+            logger.error(f"Failed to load Faiss metadata from {self.meta_file}: {e}")
+
+    def _build_base_index(self) -> "faiss.Index":
+        """Builds the base index for the configured index_type.
+
+        'hnsw' (default) searches in ~log(n) instead of the O(n) scan a
+        flat index pays per query; 'ivfpq' additionally compresses vectors
+        for large corpora but must be trained on the first batch; 'flat'
+        keeps the exact brute-force behavior.
+        """
+        if self.index_type == "flat":
+            return faiss.IndexFlatL2(self.dimension)
+        if self.index_type == "hnsw":
+            base = faiss.IndexHNSWFlat(
+                self.dimension, self.db_config.get("hnsw_m", 32)
+            )
+            base.hnsw.efConstruction = self.db_config.get("hnsw_ef_construction", 200)
+            return base
+        if self.index_type == "ivfpq":
+            nlist = self.db_config.get("ivf_nlist", 256)
+            pq_m = self.db_config.get("pq_m", 8)
+            quantizer = faiss.IndexFlatL2(self.dimension)
+            return faiss.IndexIVFPQ(quantizer, self.dimension, nlist, pq_m, 8)
+        raise ValueError(
+            f"Unknown Faiss index_type '{self.index_type}'. "
+            "Expected 'flat', 'hnsw' or 'ivfpq'."
+        )
+
     def upsert_batch(self, vectors: List[Dict[str, Any]]):
         if not self.index:
             raise ConnectionError("Faiss index not initialized.")
         if not vectors:
             return
 
-        # 1. Prepare vectors and ids for Faiss
-        vector_array = np.array([v["vector"] for v in vectors], dtype="float32")
-        ids = []
-
-        # 2. Assign int ids and store mappings
-        for v in vectors:
-            int_id = self.id_counter
-            self.id_counter += 1
-            ids.append(int_id)
-            self.id_map[int_id] = v["id"]
-            self.data_store[v["id"]] = v["metadata"]
-
-        ids_array = np.array(ids, dtype="int64")
+        # 1. Stack vectors once; float32 ndarray rows from the loader are
+        # consumed without a Python-float round-trip, and the contiguous
+        # result crosses into Faiss's C++ side via the buffer protocol
+        vector_array = np.asarray([v["vector"] for v in vectors], dtype="float32")
+
+        # 2. Derive stable int ids and bulk-update the mappings: dict.update
+        # walks the pairs in C instead of paying one interpreted store per
+        # vector
+        str_ids = [v["id"] for v in vectors]
+        ids_array = np.fromiter(
+            (_int64_id(s) for s in str_ids), dtype=np.int64, count=len(str_ids)
+        )
+        self.id_map.update(zip(ids_array.tolist(), str_ids))
+        self.data_store.update((v["id"], v["metadata"]) for v in vectors)
 
         # 3. Add to Faiss index with ids
         try:
+            # IVF-PQ must learn its coarse/product quantizers before any
+            # add; the first batch serves as the training sample
+            if not self.index.is_trained:
+                logger.info(
+                    f"Training Faiss '{self.index_type}' index on first batch "
+                    f"({len(vector_array)} vectors)."
+                )
+                self.index.train(vector_array)
             self.index.add_with_ids(vector_array, ids_array)
             logger.debug(f"Successfully added {len(vectors)} vectors to Faiss index.")
         except Exception as e:
@@ -77,12 +156,22 @@ class FaissConnector(DBConnectorBase):
         if self.index:
             try:
                 faiss.write_index(self.index, str(self.save_file))
-                logger.info(f"Faiss index saved to {self.save_file}")
-                # Also save metadata store here
+                # One write for both stores; they are only consistent as a
+                # pair with the index written above
+                with open(self.meta_file, "wb") as f:
+                    pickle.dump(
+                        {"data_store": self.data_store, "id_map": self.id_map},
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+                logger.info(
+                    f"Faiss index and metadata saved to {self.save_file}"
+                )
             except Exception as e:
                 logger.warning(f"Error saving Faiss index: {e}")
         self.index = None
         self.data_store = {}
+        self.id_map = {}
 
     def search(
         self, query_vector: List[float], limit: int = 10
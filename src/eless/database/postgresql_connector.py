@@ -1,23 +1,41 @@
 import logging
+from contextlib import contextmanager
 from typing import Dict, Any, List
 import os
 import json
 from .db_connector_base import DBConnectorBase
 import psycopg2
-from psycopg2 import sql
-from psycopg2.extras import Json
+from psycopg2 import pool, sql
+from psycopg2.extras import Json, execute_values
 
 logger = logging.getLogger("ELESS.PostgreSQLConnector")
 
+# Optional async driver: when present, the loader drives upserts through
+# asyncpg's pipelined executemany instead of a blocking pool thread
+try:
+    import asyncpg
+
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    asyncpg = None
+    ASYNCPG_AVAILABLE = False
+
 
 class PostgreSQLConnector(DBConnectorBase):
     """Concrete connector for PostgreSQL using the pgvector extension."""
 
+    supports_async = ASYNCPG_AVAILABLE
+
     def __init__(self, config: Dict[str, Any], connection_name: str, dimension: int):
         super().__init__(config, connection_name, dimension)
-        self.conn = None
+        self.pool = None
+        self._async_pool = None
         self.table_name = self.db_config.get("table_name", "eless_vectors")
         self.vector_column = self.db_config.get("vector_column", "embedding")
+        self.pool_min_size = self.db_config.get("pool_min_size", 2)
+        self.pool_max_size = self.db_config.get("pool_max_size", 8)
+        # Composed once in connect(); identifiers never change afterwards
+        self._insert_query = None
         
         # Support both DSN and individual parameters
         self.dsn = self.db_config.get("dsn") or os.environ.get("POSTGRES_DSN")
@@ -37,11 +55,15 @@ class PostgreSQLConnector(DBConnectorBase):
             # Check if PostgreSQL instance is running
             self._check_postgresql_running()
 
-            # Connect to the database
-            self.conn = psycopg2.connect(self.dsn)
-            self.conn.autocommit = True
+            # A small thread-safe pool instead of one shared synchronous
+            # connection: concurrent upserts/searches (the loader fans out
+            # on threads) each check out their own session rather than
+            # serializing on a single socket
+            self.pool = pool.ThreadedConnectionPool(
+                self.pool_min_size, self.pool_max_size, self.dsn
+            )
 
-            with self.conn.cursor() as cur:
+            with self._pooled_conn() as conn, conn.cursor() as cur:
                 # 1. Enable pgvector extension
                 cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
 
@@ -60,14 +82,42 @@ class PostgreSQLConnector(DBConnectorBase):
                 )
                 cur.execute(create_table_query)
 
+            self._insert_query = sql.SQL(
+                "INSERT INTO {} (id, {}, metadata) VALUES %s "
+                "ON CONFLICT (id) DO UPDATE SET {} = EXCLUDED.{}, metadata = EXCLUDED.metadata"
+            ).format(
+                sql.Identifier(self.table_name),
+                sql.Identifier(self.vector_column),
+                sql.Identifier(self.vector_column),
+                sql.Identifier(self.vector_column),
+            )
+
             logger.info(
                 f"PostgreSQL connection successful. Table '{self.table_name}' ready."
             )
         except Exception as e:
             logger.error(f"Failed to connect or set up PostgreSQL/pgvector: {e}")
-            self.conn = None
+            if self.pool is not None:
+                self.pool.closeall()
+            self.pool = None
             raise
 
+    @contextmanager
+    def _pooled_conn(self):
+        """Checks a connection out of the pool for the calling thread.
+
+        Connections are handed out in autocommit mode; statements here are
+        single-statement upserts/queries, so explicit transactions would
+        only add commit round-trips.
+        """
+        conn = self.pool.getconn()
+        try:
+            if not conn.autocommit:
+                conn.autocommit = True
+            yield conn
+        finally:
+            self.pool.putconn(conn)
+
     def _check_postgresql_running(self):
         """Check if PostgreSQL instance is running."""
         try:
@@ -83,39 +133,76 @@ class PostgreSQLConnector(DBConnectorBase):
             )
 
     def upsert_batch(self, vectors: List[Dict[str, Any]]):
-        if not self.conn:
+        if not self.pool:
             raise ConnectionError("PostgreSQL connection not initialized.")
         if not vectors:
             return
 
         try:
-            with self.conn.cursor() as cur:
-                insert_query = sql.SQL(
-                    "INSERT INTO {} (id, {}, metadata) VALUES (%s, %s, %s) "
-                    "ON CONFLICT (id) DO UPDATE SET {} = EXCLUDED.{}, metadata = EXCLUDED.metadata"
-                ).format(
-                    sql.Identifier(self.table_name),
-                    sql.Identifier(self.vector_column),
-                    sql.Identifier(self.vector_column),
-                    sql.Identifier(self.vector_column),
-                )
-
+            with self._pooled_conn() as conn, conn.cursor() as cur:
                 # Prepare data tuples: (id, vector, metadata_json)
                 # Use Json() for proper JSONB handling
                 data = [(v["id"], v["vector"], Json(v["metadata"])) for v in vectors]
 
-                # Use executemany for batch insertion
-                cur.executemany(insert_query, data)
-                # No need for commit() since autocommit is True
+                # One multi-VALUES statement per batch: executemany issues a
+                # parse/plan/execute round-trip per row, which dominates the
+                # upsert at typical batch sizes
+                execute_values(cur, self._insert_query, data, page_size=len(data))
                 logger.debug(
                     f"Successfully upserted {len(vectors)} vectors to PostgreSQL."
                 )
 
         except Exception as e:
             logger.error(f"PostgreSQL upsert failed: {e}")
-            # No need for rollback() since autocommit is True
             raise
 
+    async def upsert_batch_async(self, vectors: List[Dict[str, Any]]):
+        """Async upsert over asyncpg, pipelining the whole batch.
+
+        asyncpg's executemany prepares the statement once and streams all
+        binds without awaiting a round-trip per row, so a high-latency
+        server keeps the batch in flight on one connection. The pool is
+        created lazily on the loader's event loop.
+        """
+        if not vectors:
+            return
+        if self._async_pool is None:
+            self._async_pool = await asyncpg.create_pool(
+                self.dsn, min_size=1, max_size=self.pool_max_size
+            )
+
+        # pgvector's text form; the cast happens server-side, so no client
+        # type registration is needed
+        records = [
+            (
+                v["id"],
+                "[" + ",".join(map(str, v["vector"])) + "]",
+                json.dumps(v["metadata"]),
+            )
+            for v in vectors
+        ]
+        query = (
+            f'INSERT INTO "{self.table_name}" (id, "{self.vector_column}", metadata) '
+            f"VALUES ($1, $2::vector, $3::jsonb) "
+            f'ON CONFLICT (id) DO UPDATE SET "{self.vector_column}" = '
+            f'EXCLUDED."{self.vector_column}", metadata = EXCLUDED.metadata'
+        )
+        try:
+            async with self._async_pool.acquire() as conn:
+                await conn.executemany(query, records)
+            logger.debug(
+                f"Successfully upserted {len(vectors)} vectors to PostgreSQL (async)."
+            )
+        except Exception as e:
+            logger.error(f"PostgreSQL async upsert failed: {e}")
+            raise
+
+    async def close_async(self):
+        """Closes the asyncpg pool; must run on the loop that created it."""
+        if self._async_pool is not None:
+            await self._async_pool.close()
+            self._async_pool = None
+
     def search(
         self, query_vector: List[float], limit: int = 10
     ) -> List[Dict[str, Any]]:
@@ -129,11 +216,11 @@ class PostgreSQLConnector(DBConnectorBase):
         Returns:
             List of search results with scores and metadata
         """
-        if not self.conn:
+        if not self.pool:
             raise ConnectionError("PostgreSQL connection not initialized.")
-        
+
         try:
-            with self.conn.cursor() as cur:
+            with self._pooled_conn() as conn, conn.cursor() as cur:
                 # Use cosine distance operator from pgvector
                 search_query = sql.SQL(
                     "SELECT id, metadata, 1 - ({} <=> %s::vector) AS score "
@@ -160,10 +247,10 @@ class PostgreSQLConnector(DBConnectorBase):
             raise
 
     def close(self):
-        if self.conn:
-            self.conn.close()
-            self.conn = None
-            logger.debug("PostgreSQL connection closed.")
+        if self.pool:
+            self.pool.closeall()
+            self.pool = None
+            logger.debug("PostgreSQL connection pool closed.")
 
     def check_connection(self) -> bool:
-        return self.conn is not None
+        return self.pool is not None and not self.pool.closed
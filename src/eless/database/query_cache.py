@@ -0,0 +1,83 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class QueryCache:
+    """Thread-safe LRU cache for vector search results, with a TTL.
+
+    RAG query streams repeat heavily; serving a repeated query from
+    memory skips the embedding-store round-trip entirely. Entries are
+    keyed by a digest of the (float32) query vector plus the result
+    limit, expire after ttl_seconds, and the least recently used entry
+    is evicted once max_size is reached. Writers call invalidate() so
+    stale results never outlive an upsert.
+    """
+
+    def __init__(self, max_size: int = 256, ttl_seconds: float = 300.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.RLock()
+        # key -> (expires_at, results); insertion order doubles as LRU order
+        self._entries: "OrderedDict[Tuple[bytes, int], Tuple[float, List]]" = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(query_vector, limit: int) -> Tuple[bytes, int]:
+        """Builds a cache key from a query vector and result limit."""
+        digest = hashlib.blake2b(
+            np.ascontiguousarray(query_vector, dtype="float32").tobytes(),
+            digest_size=16,
+        ).digest()
+        return digest, limit
+
+    def get(self, key: Tuple[bytes, int]) -> Optional[List]:
+        """Returns cached results for key, or None on miss/expiry."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, results = entry
+            if expires_at < now:
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            # Shallow copy so callers can re-sort/trim without corrupting
+            # the cached value
+            return list(results)
+
+    def put(self, key: Tuple[bytes, int], results: List):
+        """Stores results for key, evicting the LRU entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """Drops all cached results; called after any upsert."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Returns hit/miss counters, current size, and hit rate."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hit_rate": (self._hits / total) if total else 0.0,
+            }
@@ -51,15 +51,11 @@ def check_embedding_model() -> Tuple[bool, str]:
 def check_database(db_name: str, import_name: str) -> Tuple[bool, str]:
     """Check if a database connector is available."""
     try:
-        if db_name == "chromadb":
-            __import__("chromadb")
-            __import__("langchain_community")
-        else:
-            __import__(import_name)
+        __import__(import_name)
         return True, f"{db_name} installed [OK]"
     except ImportError:
         install_cmd = {
-            "chromadb": "pip install chromadb langchain-community",
+            "chromadb": "pip install chromadb",
             "qdrant": "pip install qdrant-client",
             "faiss": "pip install faiss-cpu",
             "psycopg2": "pip install psycopg2-binary",
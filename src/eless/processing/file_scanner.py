@@ -109,15 +109,43 @@ class FileScanner:
             skipped_files = 0
             error_files = 0
 
-            for root, _, files in os.walk(input_path):
-                root_path = Path(root)
-                for file_name in files:
-                    total_files += 1
-                    file_path = root_path / file_name
+            # Walk with an explicit os.scandir stack: each directory is
+            # listed exactly once, and rejected extensions are pruned from
+            # the readdir name alone, so unsupported files never cost a
+            # stat syscall. Accepted files reuse the DirEntry's cached stat.
+            stack = [str(input_path)]
+            while stack:
+                current_dir = stack.pop()
+                try:
+                    entries = os.scandir(current_dir)
+                except OSError as e:
+                    logger.error(f"Cannot list directory {current_dir}: {e}")
+                    continue
+                with entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        total_files += 1
+                        extension = os.path.splitext(entry.name)[1].lower()
+                        if extension not in self.supported_extensions:
+                            logger.debug(
+                                f"Skipping file {entry.name}: Unsupported extension {extension}"
+                            )
+                            skipped_files += 1
+                            continue
+                        # Follow symlinks here: os.walk listed symlinked
+                        # files too (only directory recursion stays no-follow)
+                        if not entry.is_file():
+                            skipped_files += 1
+                            continue
 
-                    if file_path.suffix.lower() in self.supported_extensions:
+                        file_path = Path(entry.path)
                         try:
                             file_data = self._process_file(file_path)
+                            # DirEntry caches the stat result; expose the size
+                            # so downstream memory estimates can skip re-stat
+                            file_data["size_bytes"] = entry.stat().st_size
                             files_found.append(file_data)
                         except Exception as e:
                             logger.error(
@@ -129,17 +157,12 @@ class FileScanner:
                                 "path": file_path,
                                 "hash": "ERROR",
                                 "file_id": "ERROR",
-                                "extension": file_path.suffix.lower(),
+                                "extension": extension,
                             }
                             files_found.append(file_data)
                             error_files += 1
                             # Continue to next file on error
                             continue
-                    else:
-                        logger.debug(
-                            f"Skipping file {file_path.name}: Unsupported extension {file_path.suffix}"
-                        )
-                        skipped_files += 1
 
             logger.info(
                 f"Directory scan complete. Total: {total_files}, Found: {len(files_found)}, Skipped: {skipped_files}, Errors: {error_files}"
@@ -102,7 +102,11 @@ class StreamingDocumentProcessor:
             raise
 
     def process_large_text_file(
-        self, file_path: Path, file_hash: str, chunker_func
+        self,
+        file_path: Path,
+        file_hash: str,
+        chunker_func,
+        text_stream: Optional[Iterator[str]] = None,
     ) -> Iterator[Dict[str, Any]]:
         """
         Process large text files using streaming to minimize memory usage.
@@ -111,6 +115,9 @@ class StreamingDocumentProcessor:
             file_path: Path to the text file
             file_hash: Unique hash identifier for the file
             chunker_func: Function to chunk text into smaller pieces
+            text_stream: Optional pre-filled iterator of text blocks to
+                consume instead of reading the file here (e.g. a batched
+                reader that amortizes syscalls)
 
         Yields:
             Chunk dictionaries with text and metadata
@@ -122,8 +129,11 @@ class StreamingDocumentProcessor:
         buffer_limit = self.chunk_buffer_size * 4  # 32KB buffer
         chunk_index = 0
 
+        if text_stream is None:
+            text_stream = self.stream_text_chunks(file_path)
+
         try:
-            for file_chunk in self.stream_text_chunks(file_path):
+            for file_chunk in text_stream:
                 text_buffer += file_chunk
 
                 # When buffer gets large enough, process it and keep remainder
@@ -106,8 +106,17 @@ def run_tutorial():
 
             import yaml
 
+            from .core.config_loader import YAML_SAFE_DUMPER
+
             with open(config_path, "w") as f:
-                yaml.dump(config, f, default_flow_style=False, indent=2)
+                yaml.dump(
+                    config,
+                    f,
+                    Dumper=YAML_SAFE_DUMPER,
+                    default_flow_style=False,
+                    indent=2,
+                    sort_keys=False,
+                )
 
             click.secho(f"\n[OK] Configuration saved to: {config_path}", fg="green")
         except Exception as e:
@@ -266,6 +266,35 @@ class TestConfigValidation(unittest.TestCase):
         self.assertIn('parallel_processing', config)
         self.assertIn('resource_limits', config)
 
+    def test_final_config_does_not_pollute_defaults(self):
+        """Nested user overrides must not leak into later merges."""
+        user_config = {
+            'databases': {
+                'connections': {
+                    'injected': {'type': 'chroma', 'path': '/tmp/injected'}
+                }
+            }
+        }
+        config_path = self.save_config(user_config, 'override_config.yaml')
+
+        merged = self.config_loader.get_final_config(str(config_path))
+        self.assertIn('injected', merged['databases']['connections'])
+
+        # A clean merge on the same loader must not see the override
+        clean = self.config_loader.get_final_config()
+        self.assertNotIn('injected', clean['databases']['connections'])
+
+    def test_merge_configs_leaves_inputs_untouched(self):
+        """merge_configs must not mutate either input dict."""
+        base = {'embedding': {'batch_size': 32, 'normalize': True}}
+        override = {'embedding': {'batch_size': 64}}
+
+        merged = self.config_loader.merge_configs(base, override)
+
+        self.assertEqual(merged['embedding']['batch_size'], 64)
+        self.assertEqual(base['embedding']['batch_size'], 32)
+        self.assertEqual(override, {'embedding': {'batch_size': 64}})
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,104 @@
+import unittest
+import tempfile
+import shutil
+import json
+from pathlib import Path
+
+from eless.core.state_manager import StateManager, FileStatus
+
+
+class TestStateManager(unittest.TestCase):
+    def setUp(self):
+        """Setup a fresh cache directory and manager for each test."""
+        self.temp_dir = tempfile.mkdtemp(prefix='eless_state_test_')
+        self.config = {
+            'cache': {
+                'directory': self.temp_dir,
+                'manifest_file': 'manifest.json'
+            }
+        }
+        self.state_manager = StateManager(self.config)
+        self.manifest_path = Path(self.temp_dir) / 'manifest.json'
+
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def read_manifest_from_disk(self):
+        """Helper to read the manifest file bypassing the StateManager."""
+        with open(self.manifest_path, 'r') as f:
+            return json.load(f)
+
+    def test_add_or_update_file_writes_through(self):
+        """Immediate updates persist without an explicit flush."""
+        self.state_manager.add_or_update_file(
+            'hash1', FileStatus.CHUNKED, file_path='/tmp/a.txt'
+        )
+        on_disk = self.read_manifest_from_disk()
+        self.assertEqual(on_disk['hash1']['status'], FileStatus.CHUNKED)
+
+    def test_deferred_update_persists_only_on_flush(self):
+        """Deferred updates are in-memory until flush() writes them out."""
+        self.state_manager.add_or_update_file_deferred(
+            'hash1', FileStatus.CHUNKED, file_path='/tmp/a.txt'
+        )
+
+        # Visible in memory immediately
+        self.assertEqual(self.state_manager.get_status('hash1'), FileStatus.CHUNKED)
+        # But not yet on disk
+        self.assertFalse(self.manifest_path.exists())
+
+        self.state_manager.flush()
+        on_disk = self.read_manifest_from_disk()
+        self.assertEqual(on_disk['hash1']['status'], FileStatus.CHUNKED)
+
+        # A reloaded manager resumes from the flushed state
+        reloaded = StateManager(self.config)
+        self.assertEqual(reloaded.get_status('hash1'), FileStatus.CHUNKED)
+
+    def test_flush_without_pending_changes_is_noop(self):
+        """flush() with no deferred updates does not create a manifest."""
+        self.state_manager.flush()
+        self.assertFalse(self.manifest_path.exists())
+
+    def test_deferred_batch_flushes_all_transitions(self):
+        """Many deferred transitions land in one flush."""
+        for i in range(10):
+            self.state_manager.add_or_update_file_deferred(
+                f'hash{i}', FileStatus.LOADED, file_path=f'/tmp/{i}.txt'
+            )
+        self.state_manager.flush()
+        on_disk = self.read_manifest_from_disk()
+        self.assertEqual(len(on_disk), 10)
+        for i in range(10):
+            self.assertEqual(on_disk[f'hash{i}']['status'], FileStatus.LOADED)
+
+    def test_get_status_bulk(self):
+        """Bulk lookup returns tracked statuses and PENDING for unknowns."""
+        self.state_manager.add_or_update_file(
+            'known1', FileStatus.LOADED, file_path='/tmp/a.txt'
+        )
+        self.state_manager.add_or_update_file(
+            'known2', FileStatus.EMBEDDED, file_path='/tmp/b.txt'
+        )
+
+        statuses = self.state_manager.get_status_bulk(['known1', 'known2', 'unknown'])
+        self.assertEqual(statuses['known1'], FileStatus.LOADED)
+        self.assertEqual(statuses['known2'], FileStatus.EMBEDDED)
+        self.assertEqual(statuses['unknown'], FileStatus.PENDING)
+
+    def test_get_status_bulk_matches_single_lookups(self):
+        """Bulk and single lookups agree for every queried hash."""
+        self.state_manager.add_or_update_file(
+            'hash1', FileStatus.ERROR, file_path='/tmp/a.txt'
+        )
+        hashes = ['hash1', 'missing']
+        statuses = self.state_manager.get_status_bulk(hashes)
+        for file_hash in hashes:
+            self.assertEqual(
+                statuses[file_hash], self.state_manager.get_status(file_hash)
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()